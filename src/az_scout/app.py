@@ -4,10 +4,11 @@ Interactive web tool to visualize how Azure maps logical availability zones
 to physical zones across subscriptions in a given region.
 """
 
+import asyncio
 import logging
 import threading
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import Any
 
@@ -26,7 +27,12 @@ from az_scout.plugins import get_plugin_metadata, register_plugins
 from az_scout.routes import router as plugin_manager_router
 from az_scout.routes.discovery import router as discovery_router
 from az_scout.routes.sku_detail import router as sku_detail_router
-from az_scout.services.ai_chat import is_chat_enabled
+from az_scout.services.ai_chat import (
+    AZURE_OPENAI_ENDPOINT,
+    aclose_http_client,
+    is_chat_enabled,
+    warm_up_http_client,
+)
 
 _PKG_DIR = Path(__file__).resolve().parent
 
@@ -58,8 +64,22 @@ async def _lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     # Re-create the session manager if a previous instance was already used
     # (e.g. across multiple TestClient contexts in tests).
     _ensure_fresh_session_manager()
-    async with _mcp_server.session_manager.run():
-        yield
+    # Open the Azure OpenAI connection in the background so the first chat
+    # turn does not pay for DNS and the TLS handshake.
+    warmup: asyncio.Task[None] | None = None
+    if is_chat_enabled():
+        warmup = asyncio.create_task(warm_up_http_client(AZURE_OPENAI_ENDPOINT))
+    try:
+        async with _mcp_server.session_manager.run():
+            yield
+    finally:
+        # Stop a warm-up still in flight, then release pooled Azure OpenAI
+        # connections held by the AI chat client.
+        if warmup is not None:
+            warmup.cancel()
+            with suppress(asyncio.CancelledError):
+                await warmup
+        await aclose_http_client()
 
 
 app = FastAPI(
@@ -108,7 +108,7 @@ def get_sku_availability(
 
     enrich_skus_with_confidence(result)
 
-    return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
 
 
 def get_spot_scores(
@@ -136,7 +136,7 @@ def get_spot_scores(
         instance_count,
         tenant_id,
     )
-    return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
 
 
 def get_sku_deployment_confidence(
@@ -247,7 +247,7 @@ def get_sku_deployment_confidence(
             "warnings": warnings,
             "errors": errors,
         },
-        indent=2,
+        separators=(",", ":"),
     )
 
 
@@ -310,4 +310,4 @@ def get_sku_detail(
             sig = signals_from_sku(profile, instance_count=instance_count)
             confidence = compute_deployment_confidence(sig)
             result["confidence"] = confidence.model_dump()
-    return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
@@ -23,4 +23,4 @@ def get_zone_mappings(
     zone when they reference the same logical zone number.
     """
     result = azure_api.get_mappings(region, subscription_ids, tenant_id)
-    return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
@@ -75,7 +75,7 @@ def list_tenants() -> str:
     available tenants before querying subscriptions.
     """
     result = azure_api.list_tenants()
-    return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
 
 
 @mcp.tool()
@@ -90,7 +90,7 @@ def list_subscriptions(
     alphabetically.
     """
     result = azure_api.list_subscriptions(tenant_id)
-    return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
 
 
 @mcp.tool()
@@ -106,4 +106,4 @@ def list_regions(
     AZ-enabled region.
     """
     result = azure_api.list_regions(subscription_id, tenant_id)
-    return json.dumps(result, indent=2)
+    return json.dumps(result, separators=(",", ":"))
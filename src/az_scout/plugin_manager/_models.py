@@ -1,6 +1,7 @@
 """Data classes for the plugin manager."""
 
 from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass
@@ -24,6 +25,23 @@ class PluginValidationResult:
     warnings: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready dict (flat, cheaper than ``dataclasses.asdict``)."""
+        return {
+            "ok": self.ok,
+            "owner": self.owner,
+            "repo": self.repo,
+            "repo_url": self.repo_url,
+            "ref": self.ref,
+            "source": self.source,
+            "resolved_sha": self.resolved_sha,
+            "distribution_name": self.distribution_name,
+            "version": self.version,
+            "entry_points": dict(self.entry_points),
+            "warnings": list(self.warnings),
+            "errors": list(self.errors),
+        }
+
 
 @dataclass
 class InstalledPluginRecord:
@@ -40,6 +58,23 @@ class InstalledPluginRecord:
     latest_sha: str | None = None
     update_available: bool | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready dict (flat, cheaper than ``dataclasses.asdict``)."""
+        return {
+            "distribution_name": self.distribution_name,
+            "repo_url": self.repo_url,
+            "ref": self.ref,
+            "resolved_sha": self.resolved_sha,
+            "entry_points": dict(self.entry_points),
+            "installed_at": self.installed_at,
+            "actor": self.actor,
+            "source": self.source,
+            "last_checked_at": self.last_checked_at,
+            "latest_ref": self.latest_ref,
+            "latest_sha": self.latest_sha,
+            "update_available": self.update_available,
+        }
+
 
 @dataclass
 class RecommendedPlugin:
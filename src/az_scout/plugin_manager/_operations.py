@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.metadata
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
@@ -28,6 +29,9 @@ from az_scout.plugin_manager._storage import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent GitHub / PyPI probes when checking many plugins.
+_PROBE_MAX_WORKERS = 8
+
 
 def install_plugin(
     repo_url: str,
@@ -248,6 +252,35 @@ def uninstall_plugin(
     return True, []
 
 
+_LatestProbe = tuple[str, str | None] | Exception | None
+
+
+def _probe_latest(record: InstalledPluginRecord) -> _LatestProbe:
+    """Look up the latest release of *record* on its source.
+
+    Returns ``(latest_ref, latest_sha)`` (``latest_sha`` is ``None`` for PyPI),
+    ``None`` when the GitHub URL cannot be parsed, or the exception raised
+    by the lookup.
+    """
+    try:
+        if record.source == "pypi":
+            return fetch_pypi_latest_version(record.distribution_name), None
+        gh = parse_github_repo_url(record.repo_url)
+        if gh is None:
+            return None
+        return fetch_latest_ref(gh.owner, gh.repo)
+    except Exception as exc:
+        return exc
+
+
+def _probe_all_latest(records: list[InstalledPluginRecord]) -> list[_LatestProbe]:
+    """Probe the latest release of every record concurrently (order preserved)."""
+    if not records:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(records), _PROBE_MAX_WORKERS)) as pool:
+        return list(pool.map(_probe_latest, records))
+
+
 def check_updates(
     actor: str,
     client_ip: str,
@@ -258,7 +291,7 @@ def check_updates(
     results: list[dict[str, Any]] = []
     now = datetime.now(UTC).isoformat()
 
-    for record in records:
+    for record, probe in zip(records, _probe_all_latest(records), strict=True):
         info: dict[str, Any] = {
             "distribution_name": record.distribution_name,
             "source": record.source,
@@ -271,37 +304,24 @@ def check_updates(
             "error": None,
         }
 
-        if record.source == "pypi":
-            try:
-                latest_version = fetch_pypi_latest_version(record.distribution_name)
-                info["latest_ref"] = latest_version
-                info["update_available"] = latest_version != record.ref
-                record.last_checked_at = now
-                record.latest_ref = latest_version
-                record.latest_sha = None
-                record.update_available = latest_version != record.ref
-            except Exception as exc:
-                info["error"] = str(exc)
-                record.last_checked_at = now
+        if probe is None:
+            info["error"] = "Invalid GitHub URL"
+        elif isinstance(probe, Exception):
+            info["error"] = str(probe)
+            record.last_checked_at = now
         else:
-            gh = parse_github_repo_url(record.repo_url)
-            if gh is None:
-                info["error"] = "Invalid GitHub URL"
-                results.append(info)
-                continue
-
-            try:
-                latest_ref, latest_sha = fetch_latest_ref(gh.owner, gh.repo)
-                info["latest_ref"] = latest_ref
-                info["latest_sha"] = latest_sha
-                info["update_available"] = latest_sha != record.resolved_sha
-                record.last_checked_at = now
-                record.latest_ref = latest_ref
-                record.latest_sha = latest_sha
-                record.update_available = latest_sha != record.resolved_sha
-            except Exception as exc:
-                info["error"] = str(exc)
-                record.last_checked_at = now
+            latest_ref, latest_sha = probe
+            if record.source == "pypi":
+                update_available = latest_ref != record.ref
+            else:
+                update_available = latest_sha != record.resolved_sha
+            info["latest_ref"] = latest_ref
+            info["latest_sha"] = latest_sha
+            info["update_available"] = update_available
+            record.last_checked_at = now
+            record.latest_ref = latest_ref
+            record.latest_sha = latest_sha
+            record.update_available = update_available
 
         results.append(info)
 
@@ -533,75 +553,42 @@ def update_all_plugins(
     """Update all installed plugins that have available updates.
 
     Returns ``(updated_count, failed_count, details)``.
+
+    Latest-release lookups run concurrently; the installs themselves stay
+    sequential since they share the packages directory and ``installed.json``.
     """
     records = load_installed()
     updated = 0
     failed = 0
     details: list[dict[str, Any]] = []
 
-    for record in records:
+    for record, probe in zip(records, _probe_all_latest(records), strict=True):
+        if probe is None or isinstance(probe, Exception):
+            details.append(
+                {
+                    "distribution_name": record.distribution_name,
+                    "ok": False,
+                    "error": "Invalid GitHub URL" if probe is None else str(probe),
+                }
+            )
+            failed += 1
+            continue
+
+        latest_ref_display, latest_sha = probe
         if record.source == "pypi":
-            try:
-                latest_version = fetch_pypi_latest_version(record.distribution_name)
-            except Exception as exc:
-                details.append(
-                    {
-                        "distribution_name": record.distribution_name,
-                        "ok": False,
-                        "error": str(exc),
-                    }
-                )
-                failed += 1
-                continue
-
-            if latest_version == record.ref:
-                details.append(
-                    {
-                        "distribution_name": record.distribution_name,
-                        "ok": True,
-                        "skipped": True,
-                        "reason": "Already up to date",
-                    }
-                )
-                continue
-            latest_ref_display = latest_version
+            up_to_date = latest_ref_display == record.ref
         else:
-            gh = parse_github_repo_url(record.repo_url)
-            if gh is None:
-                details.append(
-                    {
-                        "distribution_name": record.distribution_name,
-                        "ok": False,
-                        "error": "Invalid GitHub URL",
-                    }
-                )
-                failed += 1
-                continue
-
-            try:
-                latest_ref, latest_sha = fetch_latest_ref(gh.owner, gh.repo)
-            except Exception as exc:
-                details.append(
-                    {
-                        "distribution_name": record.distribution_name,
-                        "ok": False,
-                        "error": str(exc),
-                    }
-                )
-                failed += 1
-                continue
-
-            if latest_sha == record.resolved_sha:
-                details.append(
-                    {
-                        "distribution_name": record.distribution_name,
-                        "ok": True,
-                        "skipped": True,
-                        "reason": "Already up to date",
-                    }
-                )
-                continue
-            latest_ref_display = latest_ref
+            up_to_date = latest_sha == record.resolved_sha
+        if up_to_date:
+            details.append(
+                {
+                    "distribution_name": record.distribution_name,
+                    "ok": True,
+                    "skipped": True,
+                    "reason": "Already up to date",
+                }
+            )
+            continue
 
         ok, errors = update_plugin(
             record.distribution_name,
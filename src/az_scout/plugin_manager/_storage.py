@@ -42,6 +42,11 @@ _CATALOG_URL = "https://plugin-catalog.az-scout.com/catalog.json"
 _CATALOG_CACHE_TTL = 3600  # 1 hour
 _catalog_cache: tuple[float, list[dict[str, Any]]] | None = None
 
+# Parsed ``installed.json`` keyed by the file's stat signature, so the UI's
+# polling of ``GET /api/plugins`` does not re-read and re-parse an unchanged
+# file.  Writes through ``save_installed`` also drop it explicitly.
+_installed_cache: tuple[tuple[str, int, int, int], list[dict[str, Any]]] | None = None
+
 
 def _ensure_data_dir() -> None:
     _DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -64,15 +69,30 @@ def _record_from_dict(data: dict[str, Any]) -> InstalledPluginRecord:
         "update_available",
     }
     filtered = {k: v for k, v in data.items() if k in known_fields}
+    if isinstance(filtered.get("entry_points"), dict):
+        # Never share the mapping with the parsed-JSON cache.
+        filtered["entry_points"] = dict(filtered["entry_points"])
     return InstalledPluginRecord(**filtered)
 
 
 def load_installed() -> list[InstalledPluginRecord]:
-    """Load the list of UI-installed plugins from ``installed.json``."""
-    if not _INSTALLED_FILE.exists():
+    """Load the list of UI-installed plugins from ``installed.json``.
+
+    Fresh record objects are returned on every call; only the parsed JSON is
+    cached while the file is unchanged.
+    """
+    global _installed_cache  # noqa: PLW0603
+    try:
+        st = _INSTALLED_FILE.stat()
+    except FileNotFoundError:
         return []
+    signature = (str(_INSTALLED_FILE), st.st_mtime_ns, st.st_size, st.st_ino)
     try:
-        raw = json.loads(_INSTALLED_FILE.read_text(encoding="utf-8"))
+        if _installed_cache and _installed_cache[0] == signature:
+            raw = _installed_cache[1]
+        else:
+            raw = json.loads(_INSTALLED_FILE.read_text(encoding="utf-8"))
+            _installed_cache = (signature, raw)
         return [_record_from_dict(r) for r in raw]
     except Exception:
         logger.exception("Failed to read %s", _INSTALLED_FILE)
@@ -81,8 +101,10 @@ def load_installed() -> list[InstalledPluginRecord]:
 
 def save_installed(records: list[InstalledPluginRecord]) -> None:
     """Atomically write the installed plugins list."""
+    global _installed_cache  # noqa: PLW0603
+    _installed_cache = None
     _ensure_data_dir()
-    data = [asdict(r) for r in records]
+    data = [r.to_dict() for r in records]
     fd, tmp_path = tempfile.mkstemp(dir=str(_DATA_DIR), prefix=".installed-", suffix=".tmp")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
@@ -237,14 +237,16 @@ def get_loaded_plugins() -> list[AzScoutPlugin]:
     return list(_loaded_plugins)
 
 
+def packages_dir_dist_names() -> set[str]:
+    """Return the distribution names installed in the plugin packages directory."""
+    if not _PACKAGES_DIR.exists():
+        return set()
+    return {dist.name for dist in importlib.metadata.distributions(path=[str(_PACKAGES_DIR)])}
+
+
 def is_in_packages_dir(dist_name: str) -> bool:
     """Return True if *dist_name* is installed in the plugin packages directory."""
-    if not dist_name or not _PACKAGES_DIR.exists():
-        return False
-    for dist in importlib.metadata.distributions(path=[str(_PACKAGES_DIR)]):
-        if dist.name == dist_name:
-            return True
-    return False
+    return bool(dist_name) and dist_name in packages_dir_dist_names()
 
 
 def get_plugin_chat_modes() -> dict[str, ChatMode]:
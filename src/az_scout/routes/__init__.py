@@ -1,7 +1,7 @@
 """Plugin manager API routes – thin wrappers over :mod:`az_scout.plugin_manager`."""
 
 import asyncio
-from dataclasses import asdict
+from typing import Any
 
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
@@ -12,7 +12,7 @@ from az_scout.plugin_manager._installer import has_new_native_extensions, snapsh
 from az_scout.plugins import (
     _plugin_dist_names,
     get_loaded_plugins,
-    is_in_packages_dir,
+    packages_dir_dist_names,
     reload_plugins,
 )
 
@@ -52,19 +52,32 @@ class UpdateRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+_PRINCIPAL_NAME_HEADER = b"x-ms-client-principal-name"
+_USER_AGENT_HEADER = b"user-agent"
+
+
 def _actor(request: Request) -> tuple[str, str, str]:
     """Extract actor, client_ip, and user_agent from a request."""
     # Use OBO session user if available, else EasyAuth header
     from az_scout.routes.auth import get_session
 
+    # One pass over the raw ASGI headers (lower-cased bytes) instead of two
+    # case-insensitive ``request.headers`` lookups; first occurrence wins.
+    principal: str | None = None
+    user_agent: str | None = None
+    for key, value in request.scope["headers"]:
+        if key == _PRINCIPAL_NAME_HEADER and principal is None:
+            principal = value.decode("latin-1")
+        elif key == _USER_AGENT_HEADER and user_agent is None:
+            user_agent = value.decode("latin-1")
+
     session = get_session(request)
     if session:
         actor = session.get("user_email", session.get("user_name", "anonymous"))
     else:
-        actor = request.headers.get("X-MS-CLIENT-PRINCIPAL-NAME", "anonymous")
+        actor = principal if principal is not None else "anonymous"
     client_ip = request.client.host if request.client else ""
-    user_agent = request.headers.get("User-Agent", "")
-    return actor, client_ip, user_agent
+    return actor, client_ip, user_agent or ""
 
 
 def _require_admin(request: Request) -> None:
@@ -92,28 +105,33 @@ def _require_admin(request: Request) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _plugins_payload() -> dict[str, Any]:
+    """Build the ``GET /api/plugins`` payload (reads disk and package metadata)."""
+    installed = plugin_manager.load_installed()
+    loaded = get_loaded_plugins()
+    # One metadata scan for all plugins rather than one per plugin
+    packaged = packages_dir_dist_names() if loaded else set()
+    loaded_out: list[dict[str, Any]] = []
+    for p in loaded:
+        dist_name = _plugin_dist_names.get(p.name, "")
+        loaded_out.append(
+            {
+                "name": p.name,
+                "display_name": getattr(p, "display_name", ""),
+                "version": p.version,
+                "internal": bool(getattr(p, "internal", False)),
+                "distribution_name": dist_name,
+                "description": getattr(p, "description", ""),
+                "in_packages_dir": bool(dist_name) and dist_name in packaged,
+            }
+        )
+    return {"installed": [r.to_dict() for r in installed], "loaded": loaded_out}
+
+
 @router.get("", summary="List installed and loaded plugins")
 async def list_plugins() -> JSONResponse:
     """Return UI-installed plugins and runtime-loaded plugins."""
-    installed = plugin_manager.load_installed()
-    loaded = get_loaded_plugins()
-    return JSONResponse(
-        {
-            "installed": [asdict(r) for r in installed],
-            "loaded": [
-                {
-                    "name": p.name,
-                    "display_name": getattr(p, "display_name", ""),
-                    "version": p.version,
-                    "internal": bool(getattr(p, "internal", False)),
-                    "distribution_name": _plugin_dist_names.get(p.name, ""),
-                    "description": getattr(p, "description", ""),
-                    "in_packages_dir": is_in_packages_dir(_plugin_dist_names.get(p.name, "")),
-                }
-                for p in loaded
-            ],
-        }
-    )
+    return JSONResponse(await asyncio.to_thread(_plugins_payload))
 
 
 @router.post("/validate", summary="Validate a plugin source")
@@ -128,7 +146,7 @@ async def validate_plugin(body: ValidateRequest, request: Request) -> JSONRespon
         result = await asyncio.to_thread(
             plugin_manager.validate_plugin_repo, body.repo_url, body.ref.strip()
         )
-    return JSONResponse(asdict(result))
+    return JSONResponse(result.to_dict())
 
 
 @router.post("/install", summary="Install a plugin")
@@ -136,7 +154,7 @@ async def install_plugin(body: InstallRequest, request: Request) -> JSONResponse
     """Install a plugin from a GitHub repository or PyPI."""
     _require_admin(request)
     actor, client_ip, user_agent = _actor(request)
-    before = snapshot_native_files()
+    before = await asyncio.to_thread(snapshot_native_files)
     if plugin_manager.is_pypi_source(body.repo_url):
         ok, warnings, errors = await asyncio.to_thread(
             plugin_manager.install_pypi_plugin,
@@ -155,7 +173,7 @@ async def install_plugin(body: InstallRequest, request: Request) -> JSONResponse
             client_ip,
             user_agent,
         )
-    restart_required = ok and has_new_native_extensions(before)
+    restart_required = ok and await asyncio.to_thread(has_new_native_extensions, before)
     if ok:
         reload_plugins(request.app, request.app.state.mcp_server)
     if restart_required:
@@ -205,7 +223,7 @@ async def update_plugin(body: UpdateRequest, request: Request) -> JSONResponse:
     """Update a single plugin to the latest GitHub release/tag."""
     _require_admin(request)
     actor, client_ip, user_agent = _actor(request)
-    before = snapshot_native_files()
+    before = await asyncio.to_thread(snapshot_native_files)
     ok, errors = await asyncio.to_thread(
         plugin_manager.update_plugin,
         body.distribution_name,
@@ -213,7 +231,7 @@ async def update_plugin(body: UpdateRequest, request: Request) -> JSONResponse:
         client_ip,
         user_agent,
     )
-    restart_required = ok and has_new_native_extensions(before)
+    restart_required = ok and await asyncio.to_thread(has_new_native_extensions, before)
     if ok:
         reload_plugins(request.app, request.app.state.mcp_server)
     return JSONResponse(
@@ -228,7 +246,7 @@ async def update_plugin(body: UpdateRequest, request: Request) -> JSONResponse:
 @router.get("/recommended", summary="List recommended plugins")
 async def list_recommended() -> JSONResponse:
     """Return the curated list of recommended plugins with install status."""
-    plugins = plugin_manager.load_recommended_plugins()
+    plugins = await asyncio.to_thread(plugin_manager.load_recommended_plugins)
     return JSONResponse({"plugins": plugins})
 
 
@@ -237,14 +255,14 @@ async def update_all_plugins(request: Request) -> JSONResponse:
     """Update all installed plugins that have available updates."""
     _require_admin(request)
     actor, client_ip, user_agent = _actor(request)
-    before = snapshot_native_files()
+    before = await asyncio.to_thread(snapshot_native_files)
     updated, failed, details = await asyncio.to_thread(
         plugin_manager.update_all_plugins,
         actor,
         client_ip,
         user_agent,
     )
-    restart_required = updated > 0 and has_new_native_extensions(before)
+    restart_required = updated > 0 and await asyncio.to_thread(has_new_native_extensions, before)
     if updated > 0:
         reload_plugins(request.app, request.app.state.mcp_server)
     return JSONResponse(
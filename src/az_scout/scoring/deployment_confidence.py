@@ -49,7 +49,9 @@ outcome is guaranteed.
 
 from __future__ import annotations
 
+import bisect
 import datetime
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import BaseModel
@@ -75,6 +77,10 @@ LABEL_THRESHOLDS: list[tuple[int, str]] = [
     (0, "Very Low"),
 ]
 
+# Ascending view of LABEL_THRESHOLDS for ``bisect`` lookups.
+_LABEL_CUTOFFS: tuple[int, ...] = tuple(t for t, _ in reversed(LABEL_THRESHOLDS))
+_LABEL_NAMES: tuple[str, ...] = tuple(lbl for _, lbl in reversed(LABEL_THRESHOLDS))
+
 # Minimum number of available signals before we return a score.
 # Below this threshold the result is ``label="Unknown", score=0``.
 MIN_SIGNALS = 2
@@ -215,6 +221,26 @@ def _normalize_quota_pressure(
     return 0.1
 
 
+# Spot Placement Score label → normalised value / ranking.  Keys cover the
+# casing the Azure API returns ("High") as well as lower case, so the common
+# path is a single dict hit with no ``str.lower()`` allocation.
+_SPOT_LABEL_MAP: dict[str, float] = {
+    "High": 1.0,
+    "Medium": 0.6,
+    "Low": 0.25,
+    "high": 1.0,
+    "medium": 0.6,
+    "low": 0.25,
+}
+_SPOT_RANK: dict[str, int] = {
+    "High": 3,
+    "Medium": 2,
+    "Low": 1,
+    "high": 3,
+    "medium": 2,
+    "low": 1,
+}
+
 # Labels from the Azure Spot Placement Scores API that mean
 # "spot is definitively unavailable" — score them as 0.0, not missing.
 _SPOT_UNAVAILABLE_LABELS: frozenset[str] = frozenset(
@@ -234,9 +260,11 @@ def _normalize_spot(label: str | None) -> float | None:
     """
     if label is None:
         return None
+    value = _SPOT_LABEL_MAP.get(label)
+    if value is not None:
+        return value
     key = label.lower()
-    mapping: dict[str, float] = {"high": 1.0, "medium": 0.6, "low": 0.25}
-    value = mapping.get(key)
+    value = _SPOT_LABEL_MAP.get(key)
     if value is not None:
         return value
     if key in _SPOT_UNAVAILABLE_LABELS:
@@ -289,41 +317,46 @@ def _normalize_price_pressure(
     return max(0.0, min(1.0, (0.8 - ratio) / 0.6))
 
 
-def _compute_normalized(
-    signals: DeploymentSignals,
-) -> dict[str, tuple[float | None, str]]:
-    """Return ``{name: (normalised_value_or_None, missing_reason)}``."""
-    return {
-        "quotaPressure": (
-            _normalize_quota_pressure(
-                signals.quota_used_vcpu,
-                signals.quota_limit_vcpu,
-                signals.quota_remaining_vcpu,
-                signals.vcpus,
-                signals.instance_count,
-            ),
-            "quota data or vcpus not provided",
+# Single source of truth for every signal, in breakdown order:
+# (name, weight, normaliser, reason-if-missing).
+_SIGNAL_SPEC: tuple[tuple[str, float, Callable[[DeploymentSignals], float | None], str], ...] = (
+    (
+        "quotaPressure",
+        WEIGHTS["quotaPressure"],
+        lambda s: _normalize_quota_pressure(
+            s.quota_used_vcpu,
+            s.quota_limit_vcpu,
+            s.quota_remaining_vcpu,
+            s.vcpus,
+            s.instance_count,
         ),
-        "spot": (
-            _normalize_spot(signals.spot_score_label),
-            "spot_score_label not provided",
-        ),
-        "zones": (
-            _normalize_zones(signals.zones_available_count),
-            "zones_available_count not provided",
-        ),
-        "restrictionDensity": (
-            _normalize_restriction_density(
-                signals.restricted_zones_count,
-                signals.zones_total_count,
-            ),
-            "restricted_zones_count or zones_total_count not provided",
-        ),
-        "pricePressure": (
-            _normalize_price_pressure(signals.paygo_price, signals.spot_price),
-            "paygo_price or spot_price not provided",
-        ),
-    }
+        "quota data or vcpus not provided",
+    ),
+    (
+        "spot",
+        WEIGHTS["spot"],
+        lambda s: _normalize_spot(s.spot_score_label),
+        "spot_score_label not provided",
+    ),
+    (
+        "zones",
+        WEIGHTS["zones"],
+        lambda s: _normalize_zones(s.zones_available_count),
+        "zones_available_count not provided",
+    ),
+    (
+        "restrictionDensity",
+        WEIGHTS["restrictionDensity"],
+        lambda s: _normalize_restriction_density(s.restricted_zones_count, s.zones_total_count),
+        "restricted_zones_count or zones_total_count not provided",
+    ),
+    (
+        "pricePressure",
+        WEIGHTS["pricePressure"],
+        lambda s: _normalize_price_pressure(s.paygo_price, s.spot_price),
+        "paygo_price or spot_price not provided",
+    ),
+)
 
 
 # ===================================================================
@@ -344,16 +377,19 @@ def _check_knockouts(signals: DeploymentSignals) -> list[str]:
     - No zones available: ``zones_available_count == 0``
     """
     reasons: list[str] = []
+    remaining = signals.quota_remaining_vcpu
+    vcpus = signals.vcpus
     # Quota knockout: fleet cannot fit
-    if signals.quota_remaining_vcpu is not None and signals.vcpus is not None and signals.vcpus > 0:
-        fleet = signals.vcpus * max(signals.instance_count, 1)
-        if signals.quota_remaining_vcpu < fleet:
+    if remaining is not None and vcpus is not None and vcpus > 0:
+        instances = max(signals.instance_count, 1)
+        fleet = vcpus * instances
+        if remaining < fleet:
             reasons.append(
-                f"Insufficient quota: {signals.quota_remaining_vcpu} vCPUs remaining, "
-                f"{fleet} required ({signals.vcpus} × {max(signals.instance_count, 1)})"
+                f"Insufficient quota: {remaining} vCPUs remaining, "
+                f"{fleet} required ({vcpus} × {instances})"
             )
     # Zone knockout: no available zone
-    if signals.zones_available_count is not None and signals.zones_available_count == 0:
+    if signals.zones_available_count == 0:
         reasons.append("No availability zones available (all zones restricted or SKU not offered)")
     return reasons
 
@@ -380,20 +416,74 @@ def compute_deployment_confidence(
         Deterministic result (same inputs → same outputs, except for
         ``provenance.computedAtUtc``).
     """
-    normalized = _compute_normalized(signals)
+    return _result_from_payload(_confidence_payload(signals))
+
+
+def _result_from_payload(payload: dict[str, Any]) -> DeploymentConfidenceResult:
+    """Wrap a payload from :func:`_confidence_payload` in the result model.
+
+    Uses ``model_construct`` (no validation): every value was produced by
+    this module with the declared types, so re-validating is pure overhead.
+    """
+    breakdown = payload["breakdown"]
+    return DeploymentConfidenceResult.model_construct(
+        score=payload["score"],
+        label=payload["label"],
+        scoreType=payload["scoreType"],
+        breakdown=BreakdownDetail.model_construct(
+            components=[ComponentBreakdown.model_construct(**c) for c in breakdown["components"]],
+            weightsOriginal=breakdown["weightsOriginal"],
+            weightsUsedSum=breakdown["weightsUsedSum"],
+            renormalized=breakdown["renormalized"],
+        ),
+        missingSignals=payload["missingSignals"],
+        knockoutReasons=payload["knockoutReasons"],
+        disclaimers=payload["disclaimers"],
+        provenance=Provenance.model_construct(**payload["provenance"]),
+    )
+
+
+def _confidence_payload(
+    signals: DeploymentSignals,
+    *,
+    computed_at: str | None = None,
+) -> dict[str, Any]:
+    """Compute the score as a plain dict shaped like ``DeploymentConfidenceResult``.
+
+    The scoring itself works on dicts; the Pydantic model is only built at
+    the public boundary (:func:`compute_deployment_confidence`).  Callers
+    that immediately serialise the result use this directly.  Batch callers
+    pass one *computed_at* timestamp for the whole batch.
+    """
+    # ----- no raw inputs at all → Unknown without normalising ---------
+    if not _has_signal_inputs(signals):
+        return _make_result(
+            score=0,
+            label="Unknown",
+            score_type="basic",
+            components=[_missing_component(name, reason) for name, _w, _n, reason in _SIGNAL_SPEC],
+            weights_used_sum=0.0,
+            renormalized=False,
+            missing_signals=list(WEIGHTS),
+            knockout_reasons=[],
+            computed_at=computed_at,
+        )
 
     # ----- knockout gate: hard blockers → score 0, label Blocked ------
     knockout_reasons = _check_knockouts(signals)
 
-    # ----- identify used vs missing -----------------------------------
+    # ----- normalise, identify used vs missing (single pass) ----------
+    values: list[float | None] = []
     missing_signals: list[str] = []
     used_weights_sum = 0.0
 
-    for name, (norm_value, _reason) in normalized.items():
+    for name, weight, normalize, _reason in _SIGNAL_SPEC:
+        norm_value = normalize(signals)
+        values.append(norm_value)
         if norm_value is None:
             missing_signals.append(name)
         else:
-            used_weights_sum += WEIGHTS[name]
+            used_weights_sum += weight
 
     signals_available = len(WEIGHTS) - len(missing_signals)
     renormalized = len(missing_signals) > 0 and signals_available > 0
@@ -410,7 +500,7 @@ def compute_deployment_confidence(
 
     # ----- too few signals → Unknown ---------------------------------
     if signals_available < MIN_SIGNALS:
-        all_components = _build_all_missing_components(normalized)
+        all_components = _build_all_missing_components(values)
         return _make_result(
             score=0,
             label="Blocked" if knockout_reasons else "Unknown",
@@ -420,40 +510,32 @@ def compute_deployment_confidence(
             renormalized=False,
             missing_signals=missing_signals,
             knockout_reasons=knockout_reasons,
+            computed_at=computed_at,
         )
 
     # ----- weighted sum with renormalisation --------------------------
     weighted_sum = 0.0
-    components: list[ComponentBreakdown] = []
+    components: list[dict[str, Any]] = []
 
-    for name, (norm_value, reason) in normalized.items():
+    for (name, weight, _normalize, reason), norm_value in zip(_SIGNAL_SPEC, values, strict=True):
         if norm_value is None:
-            components.append(
-                ComponentBreakdown(
-                    name=name,
-                    score01=0.0,
-                    score100=0.0,
-                    weight=0.0,
-                    contribution=0.0,
-                    status="missing",
-                    reasonIfMissing=reason,
-                )
-            )
+            components.append(_missing_component(name, reason))
             continue
 
-        eff_weight = WEIGHTS[name] / used_weights_sum if used_weights_sum > 0 else 0.0
+        eff_weight = weight / used_weights_sum if used_weights_sum > 0 else 0.0
         contribution = norm_value * eff_weight
         weighted_sum += contribution
 
         components.append(
-            ComponentBreakdown(
-                name=name,
-                score01=round(norm_value, 4),
-                score100=round(norm_value * 100, 1),
-                weight=round(eff_weight, 4),
-                contribution=round(contribution, 4),
-                status="used",
-            )
+            {
+                "name": name,
+                "score01": round(norm_value, 4),
+                "score100": round(norm_value * 100, 1),
+                "weight": round(eff_weight, 4),
+                "contribution": round(contribution, 4),
+                "status": "used",
+                "reasonIfMissing": None,
+            }
         )
 
     score = round(weighted_sum * 100)
@@ -469,14 +551,11 @@ def compute_deployment_confidence(
             renormalized=renormalized,
             missing_signals=missing_signals,
             knockout_reasons=knockout_reasons,
+            computed_at=computed_at,
         )
 
     # ----- label mapping ----------------------------------------------
-    label = "Very Low"
-    for threshold, lbl in LABEL_THRESHOLDS:
-        if score >= threshold:
-            label = lbl
-            break
+    label = _label_for_score(score)
 
     return _make_result(
         score=score,
@@ -487,6 +566,7 @@ def compute_deployment_confidence(
         renormalized=renormalized,
         missing_signals=missing_signals,
         knockout_reasons=knockout_reasons,
+        computed_at=computed_at,
     )
 
 
@@ -505,19 +585,28 @@ def best_spot_label(zone_scores: dict[str, str]) -> str | None:
     """
     if not zone_scores:
         return None
-    rank = {"high": 3, "medium": 2, "low": 1}
     best: str | None = None
+    best_rank = 0
     for label in zone_scores.values():
-        if rank.get(label.lower(), 0) > rank.get((best or "").lower(), 0):
-            best = label
+        rank = _SPOT_RANK.get(label)
+        if rank is None:
+            rank = _SPOT_RANK.get(label.lower(), 0)
+        if rank == _SPOT_RANK["high"]:
+            return label  # nothing beats High
+        if rank > best_rank:
+            best, best_rank = label, rank
     # If no High/Medium/Low found but zones had data, return the first
     # label (e.g. "RestrictedSkuNotAvailable") so _normalize_spot can
     # map it to 0.0 instead of treating spot as entirely missing.
-    if best is None and zone_scores:
+    if best is None:
         best = next(iter(zone_scores.values()))
     return best
 
 
+# Shared read-only stand-in for missing SKU sections
+_NO_DATA: dict[str, Any] = {}
+
+
 def signals_from_sku(
     sku: dict[str, Any],
     *,
@@ -525,18 +614,28 @@ def signals_from_sku(
     instance_count: int = 1,
 ) -> DeploymentSignals:
     """Build ``DeploymentSignals`` from a raw SKU dict (as returned by ``azure_api``)."""
-    caps = sku.get("capabilities", {})
-    quota = sku.get("quota", {})
-    pricing = sku.get("pricing", {})
-    zones: list[str] = sku.get("zones", [])
-    restrictions: list[str] = sku.get("restrictions", [])
-
-    try:
-        vcpus: int | None = int(caps.get("vCPUs", 0))
-    except (TypeError, ValueError):
-        vcpus = None
+    # Absent and null sections both read as empty
+    caps = sku.get("capabilities") or _NO_DATA
+    quota = sku.get("quota") or _NO_DATA
+    pricing = sku.get("pricing") or _NO_DATA
+    zones: list[str] = sku.get("zones") or []
+    restrictions: list[str] = sku.get("restrictions") or []
+
+    raw_vcpus = caps.get("vCPUs", 0)
+    vcpus: int | None
+    if isinstance(raw_vcpus, int):
+        vcpus = raw_vcpus
+    elif isinstance(raw_vcpus, str) and raw_vcpus.isdecimal():
+        vcpus = int(raw_vcpus)  # ARM capabilities are strings, e.g. "4"
+    else:
+        try:
+            vcpus = int(raw_vcpus)
+        except (TypeError, ValueError):
+            vcpus = None
 
-    available_zones = [z for z in zones if z not in restrictions]
+    # Zone lists hold at most a handful of entries: a plain scan beats
+    # building a set, and the common unrestricted case needs no scan at all.
+    zones_available = sum(1 for z in zones if z not in restrictions) if restrictions else len(zones)
 
     return DeploymentSignals(
         quota_used_vcpu=quota.get("used"),
@@ -545,11 +644,11 @@ def signals_from_sku(
         vcpus=vcpus,
         instance_count=instance_count,
         spot_score_label=spot_score_label,
-        zones_available_count=len(available_zones),
+        zones_available_count=zones_available,
         zones_total_count=len(zones),
         restricted_zones_count=len(restrictions),
-        paygo_price=pricing.get("paygo") if pricing else None,
-        spot_price=pricing.get("spot") if pricing else None,
+        paygo_price=pricing.get("paygo"),
+        spot_price=pricing.get("spot"),
     )
 
 
@@ -558,67 +657,95 @@ def signals_from_sku(
 # ===================================================================
 
 
-def _build_all_missing_components(
-    normalized: dict[str, tuple[float | None, str]],
-) -> list[ComponentBreakdown]:
-    """Create component entries when all/most signals are missing."""
-    components: list[ComponentBreakdown] = []
-    for name, (norm_value, reason) in normalized.items():
+def _has_signal_inputs(signals: DeploymentSignals) -> bool:
+    """Return ``False`` when no normaliser (nor knockout) has the inputs it needs."""
+    return (
+        (signals.quota_remaining_vcpu is not None and signals.vcpus is not None)
+        or signals.spot_score_label is not None
+        or signals.zones_available_count is not None
+        or (signals.restricted_zones_count is not None and signals.zones_total_count is not None)
+        or (signals.paygo_price is not None and signals.spot_price is not None)
+    )
+
+
+def _label_for_score(score: int) -> str:
+    """Map a 0–100 score to its ``LABEL_THRESHOLDS`` label."""
+    return _LABEL_NAMES[max(bisect.bisect_right(_LABEL_CUTOFFS, score) - 1, 0)]
+
+
+def _missing_component(name: str, reason: str) -> dict[str, Any]:
+    """Component entry for a signal that is not available."""
+    return {
+        "name": name,
+        "score01": 0.0,
+        "score100": 0.0,
+        "weight": 0.0,
+        "contribution": 0.0,
+        "status": "missing",
+        "reasonIfMissing": reason,
+    }
+
+
+def _build_all_missing_components(values: list[float | None]) -> list[dict[str, Any]]:
+    """Create component entries when all/most signals are missing.
+
+    *values* holds the normalised value of each ``_SIGNAL_SPEC`` entry.
+    """
+    components: list[dict[str, Any]] = []
+    for (name, _weight, _normalize, reason), norm_value in zip(_SIGNAL_SPEC, values, strict=True):
         if norm_value is None:
-            components.append(
-                ComponentBreakdown(
-                    name=name,
-                    score01=0.0,
-                    score100=0.0,
-                    weight=0.0,
-                    contribution=0.0,
-                    status="missing",
-                    reasonIfMissing=reason,
-                )
-            )
+            components.append(_missing_component(name, reason))
         else:
             components.append(
-                ComponentBreakdown(
-                    name=name,
-                    score01=round(norm_value, 4),
-                    score100=round(norm_value * 100, 1),
-                    weight=0.0,
-                    contribution=0.0,
-                    status="used",
-                    reasonIfMissing="insufficient signals for scoring",
-                )
+                {
+                    "name": name,
+                    "score01": round(norm_value, 4),
+                    "score100": round(norm_value * 100, 1),
+                    "weight": 0.0,
+                    "contribution": 0.0,
+                    "status": "used",
+                    "reasonIfMissing": "insufficient signals for scoring",
+                }
             )
     return components
 
 
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601."""
+    return datetime.datetime.now(datetime.UTC).isoformat()
+
+
 def _make_result(
     *,
     score: int,
     label: str,
     score_type: str,
-    components: list[ComponentBreakdown],
+    components: list[dict[str, Any]],
     weights_used_sum: float,
     renormalized: bool,
     missing_signals: list[str],
     knockout_reasons: list[str] | None = None,
-) -> DeploymentConfidenceResult:
-    return DeploymentConfidenceResult(
-        score=score,
-        label=label,
-        scoreType=score_type,
-        breakdown=BreakdownDetail(
-            components=components,
-            weightsOriginal=dict(WEIGHTS),
-            weightsUsedSum=weights_used_sum,
-            renormalized=renormalized,
-        ),
-        missingSignals=missing_signals,
-        knockoutReasons=knockout_reasons or [],
-        disclaimers=list(DISCLAIMERS),
-        provenance=Provenance(
-            computedAtUtc=datetime.datetime.now(datetime.UTC).isoformat(),
-        ),
-    )
+    computed_at: str | None = None,
+) -> dict[str, Any]:
+    """Assemble the result payload (same shape as ``DeploymentConfidenceResult.model_dump()``)."""
+    return {
+        "score": score,
+        "label": label,
+        "scoreType": score_type,
+        "breakdown": {
+            "components": components,
+            "weightsOriginal": dict(WEIGHTS),
+            "weightsUsedSum": weights_used_sum,
+            "renormalized": renormalized,
+        },
+        "missingSignals": missing_signals,
+        "knockoutReasons": knockout_reasons or [],
+        "disclaimers": list(DISCLAIMERS),
+        "provenance": {
+            "computedAtUtc": computed_at or _now_iso(),
+            "cacheTtlSeconds": None,
+        },
+    }
 
 
 def enrich_skus_with_confidence(skus: list[dict[str, Any]]) -> None:
@@ -626,8 +753,11 @@ def enrich_skus_with_confidence(skus: list[dict[str, Any]]) -> None:
 
     Convenience wrapper around :func:`signals_from_sku` +
     :func:`compute_deployment_confidence` to reduce boilerplate in
-    route handlers and MCP tools.
+    route handlers and MCP tools.  The dict is produced directly, without
+    building and then dumping the Pydantic result model, and every SKU of
+    the batch shares the same ``provenance.computedAtUtc``.
     """
+    computed_at = _now_iso()
     for sku in skus:
         sig = signals_from_sku(sku)
-        sku["confidence"] = compute_deployment_confidence(sig).model_dump()
+        sku["confidence"] = _confidence_payload(sig, computed_at=computed_at)
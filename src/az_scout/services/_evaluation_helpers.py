@@ -7,6 +7,7 @@ decision engines. Centralised here to keep a single source of truth.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from typing import Literal
 
 from az_scout import azure_api
@@ -21,9 +22,9 @@ GPU_FAMILY_MARKERS: tuple[str, ...] = ("nc", "nd", "nv", "hb", "hc")
 
 SPOT_RANK: dict[str, int] = {"High": 3, "Medium": 2, "Low": 1, "Unknown": 0}
 
-DATA_RESIDENCY_REGIONS: dict[str, list[str]] = {
-    "FR": ["francecentral", "francesouth"],
-    "EU": [
+DATA_RESIDENCY_REGIONS: dict[str, tuple[str, ...]] = {
+    "FR": ("francecentral", "francesouth"),
+    "EU": (
         "francecentral",
         "francesouth",
         "westeurope",
@@ -38,7 +39,7 @@ DATA_RESIDENCY_REGIONS: dict[str, list[str]] = {
         "polandcentral",
         "italynorth",
         "spaincentral",
-    ],
+    ),
 }
 
 
@@ -50,19 +51,20 @@ DATA_RESIDENCY_REGIONS: dict[str, list[str]] = {
 def is_gpu_family(family: str) -> bool:
     """Return True if the SKU family is a GPU/HPC family."""
     normalized = family.lower().replace("standard", "").replace("_", "")
-    return any(normalized.startswith(m) for m in GPU_FAMILY_MARKERS)
+    return normalized.startswith(GPU_FAMILY_MARKERS)
 
 
 def best_spot_label(
     zone_scores: dict[str, str],
 ) -> Literal["High", "Medium", "Low", "Unknown"]:
     """Return the best (most optimistic) spot score across zones."""
-    if not zone_scores:
-        return "Unknown"
-    best = max(zone_scores.values(), key=lambda s: SPOT_RANK.get(s, 0))
-    if best in ("High", "Medium", "Low"):
-        return best  # type: ignore[return-value]
-    return "Unknown"
+    best = "Unknown"
+    best_rank = 0
+    for label in zone_scores.values():
+        rank = SPOT_RANK.get(label, 0)
+        if rank > best_rank:
+            best, best_rank = label, rank
+    return best  # type: ignore[return-value]
 
 
 def resolve_candidate_regions(
@@ -82,27 +84,37 @@ def resolve_candidate_regions(
     residency fallback → all regions, then deny list filtering, then optional
     truncation.
     """
+    source: Iterable[str]
+    # ARM location names and the residency tables are already lowercase;
+    # only user-supplied allow lists need case folding before the deny check.
+    fold_case = False
     if allow_regions:
-        candidates = list(allow_regions)
+        source = allow_regions
+        fold_case = True
     elif data_residency and data_residency != "ANY":
         if data_residency in DATA_RESIDENCY_REGIONS:
-            candidates = list(DATA_RESIDENCY_REGIONS[data_residency])
+            source = DATA_RESIDENCY_REGIONS[data_residency]
         else:
             warnings.append(
                 f"No region mapping for data residency '{data_residency}'."
                 " Using all available regions."
             )
-            candidates = fetch_all_regions(subscription_id, tenant_id, errors)
+            source = fetch_all_regions(subscription_id, tenant_id, errors)
     else:
-        candidates = fetch_all_regions(subscription_id, tenant_id, errors)
+        source = fetch_all_regions(subscription_id, tenant_id, errors)
 
     if deny_regions:
         deny_set = {r.lower() for r in deny_regions}
-        candidates = [r for r in candidates if r.lower() not in deny_set]
+        if fold_case:
+            source = (r for r in source if r.lower() not in deny_set)
+        else:
+            source = (r for r in source if r not in deny_set)
 
+    # Build the result in a single pass; the input lists are never returned
+    # as-is, so callers may mutate the result freely.
+    candidates = list(source)
     if max_regions is not None:
         candidates = candidates[:max_regions]
-
     return candidates
 
 
@@ -31,6 +31,12 @@ from az_scout.services.ai_chat._dispatch import (
 from az_scout.services.ai_chat._dispatch import (
     _truncate_tool_result as _truncate_tool_result,
 )
+from az_scout.services.ai_chat._http import (
+    aclose_http_client as aclose_http_client,
+)
+from az_scout.services.ai_chat._http import (
+    warm_up_http_client as warm_up_http_client,
+)
 from az_scout.services.ai_chat._prompts import (
     SYSTEM_PROMPT as SYSTEM_PROMPT,
 )
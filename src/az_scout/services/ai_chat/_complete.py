@@ -8,7 +8,6 @@ for plugin routes that need inline AI recommendations outside the chat panel.
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import hashlib
 import json
 import logging
@@ -18,23 +17,26 @@ from typing import Any
 
 from az_scout.services.ai_chat._config import (
     AZURE_OPENAI_API_KEY,
-    AZURE_OPENAI_API_VERSION,
-    AZURE_OPENAI_DEPLOYMENT,
-    AZURE_OPENAI_ENDPOINT,
+    AZURE_OPENAI_CHAT_URL,
 )
 from az_scout.services.ai_chat._dispatch import (
-    _execute_tool,
-    _get_tool_params,
+    _MAX_CONCURRENT_TOOLS,
+    _execute_tool_limited,
+    _inject_context,
     _truncate_tool_result,
 )
-from az_scout.services.ai_chat._tools import TOOL_DEFINITIONS
+from az_scout.services.ai_chat._http import (
+    _RETRYABLE_STATUS,
+    _get_http_client,
+    _retry_wait,
+)
+from az_scout.services.ai_chat._tools import _chat_request_body
 
 logger = logging.getLogger(__name__)
 
 # Reuse the same limits as the streaming path
 _MAX_TOOL_ROUNDS = 10
 _MAX_RETRIES = 3
-_DEFAULT_RETRY_WAIT = 10
 
 # In-memory TTL cache for completion results
 _CACHE_TTL = 300  # 5 minutes
@@ -124,8 +126,6 @@ async def ai_complete(
     CompletionResult:
         The final assistant text and a list of tool calls that were executed.
     """
-    import httpx
-
     key = _cache_key(prompt, system_prompt, tenant_id, region, subscription_id, tools)
     if cache_ttl > 0:
         cached = _cache_get(key, ttl=cache_ttl)
@@ -138,11 +138,7 @@ async def ai_complete(
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
 
-    url = (
-        f"{AZURE_OPENAI_ENDPOINT.rstrip('/')}/openai/deployments/"
-        f"{AZURE_OPENAI_DEPLOYMENT}/chat/completions"
-        f"?api-version={AZURE_OPENAI_API_VERSION}"
-    )
+    url = AZURE_OPENAI_CHAT_URL
     headers = {
         "Content-Type": "application/json",
         "api-key": AZURE_OPENAI_API_KEY,
@@ -150,99 +146,109 @@ async def ai_complete(
 
     tool_log: list[dict[str, Any]] = []
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        for _round in range(_MAX_TOOL_ROUNDS):
-            body: dict[str, Any] = {"messages": messages}
-            if tools and TOOL_DEFINITIONS:
-                body["tools"] = TOOL_DEFINITIONS
-                body["tool_choice"] = "auto"
-
-            # Retry loop for 429 rate-limit errors
-            resp_data: dict[str, Any] | None = None
-            for _attempt in range(_MAX_RETRIES):
-                resp = await client.post(url, json=body, headers=headers)
-                if resp.status_code == 429:
-                    retry_after = _DEFAULT_RETRY_WAIT
-                    if resp.headers.get("retry-after"):
-                        with contextlib.suppress(TypeError, ValueError):
-                            retry_after = int(resp.headers["retry-after"])
-                    if _attempt < _MAX_RETRIES - 1:
-                        logger.warning(
-                            "Azure OpenAI 429, retrying in %ss (attempt %s/%s)",
-                            retry_after,
-                            _attempt + 1,
-                            _MAX_RETRIES,
-                        )
-                        await asyncio.sleep(retry_after)
-                        continue
-                    resp.raise_for_status()
-                elif resp.status_code != 200:
-                    resp.raise_for_status()
-                else:
-                    resp_data = resp.json()
-                    break
-
-            if resp_data is None:
-                return CompletionResult(content="Error: failed to get response from AI model.")
-
-            choices = resp_data.get("choices", [])
-            if not choices:
-                return CompletionResult(content="")
-
-            choice = choices[0]
-            message = choice.get("message", {})
-            finish_reason = choice.get("finish_reason", "")
-
-            # If no tool calls, return the final content
-            if finish_reason != "tool_calls" or not message.get("tool_calls"):
-                result = CompletionResult(
-                    content=message.get("content", ""),
-                    tool_calls=tool_log,
-                )
-                if result.content and cache_ttl > 0:
-                    _cache_put(key, result)
-                return result
-
-            # Execute tool calls
-            messages.append(message)
-
-            for tc in message["tool_calls"]:
-                tool_name = tc["function"]["name"]
-                try:
-                    raw_args = tc["function"].get("arguments", "")
-                    args = json.loads(raw_args) if raw_args else {}
-                except json.JSONDecodeError:
-                    args = {}
-
-                # Auto-inject context parameters
-                if tenant_id and "tenant_id" in _get_tool_params(tool_name):
-                    args.setdefault("tenant_id", tenant_id)
-                if region and "region" in _get_tool_params(tool_name):
-                    args.setdefault("region", region)
-                if subscription_id:
-                    if "subscription_id" in _get_tool_params(tool_name):
-                        args.setdefault("subscription_id", subscription_id)
-                    if "subscription_ids" in _get_tool_params(tool_name):
-                        args.setdefault("subscription_ids", [subscription_id])
-
-                tool_result = _execute_tool(tool_name, args)
-                tool_content = _truncate_tool_result(tool_result)
-
-                tool_log.append(
-                    {
-                        "name": tool_name,
-                        "arguments": args,
-                        "result_length": len(tool_result),
-                    }
-                )
-
-                messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tc["id"],
-                        "content": tool_content,
-                    }
-                )
+    tool_slots = asyncio.Semaphore(_MAX_CONCURRENT_TOOLS)
+    client = _get_http_client()
+    for _round in range(_MAX_TOOL_ROUNDS):
+        body = _chat_request_body(messages, tools=tools)
+
+        # Retry loop for 429 / 503 responses
+        resp_data: dict[str, Any] | None = None
+        for _attempt in range(_MAX_RETRIES):
+            resp = await client.post(url, content=body, headers=headers)
+            if resp.status_code in _RETRYABLE_STATUS:
+                if _attempt < _MAX_RETRIES - 1:
+                    wait = _retry_wait(_attempt, resp.headers.get("retry-after"))
+                    logger.warning(
+                        "Azure OpenAI %s, retrying in %.1fs (attempt %s/%s)",
+                        resp.status_code,
+                        wait,
+                        _attempt + 1,
+                        _MAX_RETRIES,
+                    )
+                    await asyncio.sleep(wait)
+                    continue
+                resp.raise_for_status()
+            elif resp.status_code != 200:
+                resp.raise_for_status()
+            else:
+                resp_data = resp.json()
+                break
+
+        if resp_data is None:
+            return CompletionResult(content="Error: failed to get response from AI model.")
+
+        choices = resp_data.get("choices", [])
+        if not choices:
+            return CompletionResult(content="")
+
+        choice = choices[0]
+        message = choice.get("message", {})
+        finish_reason = choice.get("finish_reason", "")
+
+        # If no tool calls, return the final content
+        if finish_reason != "tool_calls" or not message.get("tool_calls"):
+            result = CompletionResult(
+                content=message.get("content", ""),
+                tool_calls=tool_log,
+            )
+            if result.content and cache_ttl > 0:
+                _cache_put(key, result)
+            return result
+
+        # Execute tool calls
+        messages.append(message)
+
+        prepared: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        for tc in message["tool_calls"]:
+            tool_name = tc["function"]["name"]
+            try:
+                raw_args = tc["function"].get("arguments", "")
+                args = json.loads(raw_args) if raw_args else {}
+            except json.JSONDecodeError:
+                args = {}
+
+            # Auto-inject context parameters
+            _inject_context(
+                tool_name,
+                args,
+                tenant_id=tenant_id,
+                region=region,
+                subscription_id=subscription_id,
+            )
+
+            prepared.append((tc, args))
+
+        # Run the tools of this round concurrently
+        tool_results = await asyncio.gather(
+            *(
+                _execute_tool_limited(tc["function"]["name"], args, tool_slots)
+                for tc, args in prepared
+            )
+        )
+
+        for (tc, args), tool_result in zip(prepared, tool_results, strict=True):
+            tool_name = tc["function"]["name"]
+            tool_content = _truncate_tool_result(tool_result)
+
+            tool_log.append(
+                {
+                    "name": tool_name,
+                    "arguments": args,
+                    "result_length": len(tool_result),
+                }
+            )
+
+            messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tc["id"],
+                    "content": tool_content,
+                }
+            )
+
+        # Only the truncated copies are needed from here on; release the full
+        # outputs before the next model call.
+        del tool_results, tool_result
 
     # Exhausted rounds
     result = CompletionResult(content="", tool_calls=tool_log)
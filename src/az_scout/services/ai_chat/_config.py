@@ -9,6 +9,26 @@ AZURE_OPENAI_API_KEY = os.environ.get("AZURE_OPENAI_API_KEY", "")
 AZURE_OPENAI_DEPLOYMENT = os.environ.get("AZURE_OPENAI_DEPLOYMENT", "")
 AZURE_OPENAI_API_VERSION = os.environ.get("AZURE_OPENAI_API_VERSION", "2024-10-21")
 
+# Chat completions endpoint, built once from the settings above
+AZURE_OPENAI_CHAT_URL = (
+    f"{AZURE_OPENAI_ENDPOINT.rstrip('/')}/openai/deployments/"
+    f"{AZURE_OPENAI_DEPLOYMENT}/chat/completions"
+    f"?api-version={AZURE_OPENAI_API_VERSION}"
+)
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float env var, falling back to *default* when unset or invalid."""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Merge streamed text fragments for up to this many milliseconds before
+# sending them to the browser (0 = send every fragment as it arrives)
+CHAT_DELTA_COALESCE_MS = _env_float("AZ_SCOUT_CHAT_DELTA_COALESCE_MS", 0.0)
+
 
 def is_chat_enabled() -> bool:
     """Return True if all required Azure OpenAI env vars are set."""
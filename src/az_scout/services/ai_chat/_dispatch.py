@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
-from az_scout.services.ai_chat._tools import TOOL_DEFINITIONS, _get_mcp_tools
+from az_scout.services.ai_chat._tools import (
+    _TOOL_CONTEXT_PARAMS,
+    _TOOL_PARAMS,
+    _get_mcp_tools,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,18 +26,75 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 _UUID_RE = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
 )
+_UUID_LEN = 36
 
 # Maximum characters for a single tool result in the conversation context.
 # Large results (e.g. get_sku_availability with 300+ SKUs) are truncated to
 # keep the total prompt under the model's token limit and avoid 429 errors.
 _MAX_TOOL_RESULT_CHARS = 150_000
 
+# Tool calls of one chat turn that may run at the same time
+_MAX_CONCURRENT_TOOLS = 4
+
+# Cheap shape check run before parsing an oversized result
+_JSON_ARRAY_START_RE = re.compile(r"\s*\[")
+
+# ---------------------------------------------------------------------------
+# Result cache for idempotent discovery tools
+# ---------------------------------------------------------------------------
+
+# TTL in seconds per tool.  Only tools whose Azure calls are not already
+# cached below (tenant, subscription and region discovery are, for an hour)
+# are listed here.
+_TOOL_CACHE_TTL: dict[str, int] = {
+    "get_zone_mappings": 600,
+}
+# Entries kept across all tools; least recently used ones are evicted first
+_TOOL_CACHE_MAX_ENTRIES = 256
+_tool_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+# Sync tools run in worker threads, so lookups and evictions are serialised
+_tool_cache_lock = threading.Lock()
+
+
+def _tool_cache_key(name: str, arguments: dict[str, Any]) -> str | None:
+    """Return the cache key for a tool call, or None if it must not be cached.
+
+    Results are never cached in OBO mode: tools then run with the signed-in
+    user's token and must not be shared between users.
+    """
+    if name not in _TOOL_CACHE_TTL:
+        return None
+    from az_scout.azure_api._obo import is_obo_enabled
+
+    if is_obo_enabled():
+        return None
+    return name + ":" + json.dumps(arguments, sort_keys=True, default=str)
+
+
+def _tool_cache_get(key: str, ttl: int) -> str | None:
+    """Return a cached result younger than *ttl* seconds, or None."""
+    with _tool_cache_lock:
+        entry = _tool_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= ttl:
+            return None
+        _tool_cache.move_to_end(key)
+        return entry[1]
+
+
+def _tool_cache_put(key: str, result: str) -> None:
+    """Store *result*, evicting the least recently used entries over the cap."""
+    with _tool_cache_lock:
+        _tool_cache[key] = (time.monotonic(), result)
+        _tool_cache.move_to_end(key)
+        while len(_tool_cache) > _TOOL_CACHE_MAX_ENTRIES:
+            _tool_cache.popitem(last=False)
+
 
 def _validate_subscription_id(value: str | None, param: str = "subscription_id") -> str | None:
     """Return an error JSON string if *value* is not a valid UUID, else None."""
-    if value and not _UUID_RE.match(value):
+    if value and (len(value) != _UUID_LEN or not _UUID_RE.fullmatch(value)):
         return json.dumps(
             {
                 "error": f"'{param}' must be a subscription UUID "
@@ -39,12 +106,41 @@ def _validate_subscription_id(value: str | None, param: str = "subscription_id")
     return None
 
 
-def _get_tool_params(tool_name: str) -> set[str]:
+def _get_tool_params(tool_name: str) -> frozenset[str]:
     """Return the set of parameter names for a given tool."""
-    for tool in TOOL_DEFINITIONS:
-        if tool["function"]["name"] == tool_name:
-            return set(tool["function"]["parameters"].get("properties", {}).keys())
-    return set()
+    return _TOOL_PARAMS.get(tool_name, frozenset())
+
+
+def _inject_context(
+    tool_name: str,
+    args: dict[str, Any],
+    *,
+    tenant_id: str | None,
+    region: str | None,
+    subscription_id: str | None,
+) -> None:
+    """Fill the context parameters *tool_name* accepts but the model left unset."""
+    plan = _TOOL_CONTEXT_PARAMS.get(tool_name)
+    if not plan:
+        return
+    context: dict[str, Any] = {
+        "tenant_id": tenant_id,
+        "region": region,
+        "subscription_id": subscription_id,
+        "subscription_ids": [subscription_id] if subscription_id else None,
+    }
+    for key in plan:
+        if context[key]:
+            args.setdefault(key, context[key])
+
+
+def _compact_json(obj: Any) -> str:
+    """Encode *obj* without whitespace for the model context.
+
+    Indentation costs prompt tokens without helping the model; the UI
+    pretty-prints tool output itself.
+    """
+    return json.dumps(obj, separators=(",", ":"))
 
 
 def _truncate_tool_result(result: str) -> str:
@@ -57,6 +153,10 @@ def _truncate_tool_result(result: str) -> str:
     if len(result) <= _MAX_TOOL_RESULT_CHARS:
         return result
 
+    # Only JSON arrays get smart truncation; don't parse anything else
+    if not _JSON_ARRAY_START_RE.match(result):
+        return result[:_MAX_TOOL_RESULT_CHARS] + "\n… (truncated)"
+
     # Try smart truncation for JSON arrays
     try:
         data = json.loads(result)
@@ -64,18 +164,19 @@ def _truncate_tool_result(result: str) -> str:
         return result[:_MAX_TOOL_RESULT_CHARS] + "\n… (truncated)"
 
     if isinstance(data, list) and len(data) > 1:
-        # Keep items until we approach the budget
-        kept: list[Any] = []
-        current_len = 2  # for "[]"
+        # Encode each item once, compactly, and keep items until the output
+        # approaches the budget.
+        kept: list[str] = []
+        current_len = 2  # for "[" and "]"
         for item in data:
-            item_json = json.dumps(item)
-            # +3 for ", " separator and safety margin
-            if current_len + len(item_json) + 3 > _MAX_TOOL_RESULT_CHARS - 200:
+            item_json = _compact_json(item)
+            # +1 for the "," separator
+            if current_len + len(item_json) + 1 > _MAX_TOOL_RESULT_CHARS - 200:
                 break
-            kept.append(item)
-            current_len += len(item_json) + 2  # ", "
+            kept.append(item_json)
+            current_len += len(item_json) + 1
         omitted = len(data) - len(kept)
-        truncated = json.dumps(kept, indent=2)
+        truncated = "[" + ",".join(kept) + "]"
         if omitted > 0:
             truncated += (
                 f"\n\n// {omitted} more items omitted "
@@ -87,6 +188,103 @@ def _truncate_tool_result(result: str) -> str:
     return result[:_MAX_TOOL_RESULT_CHARS] + "\n… (truncated)"
 
 
+def _handle_switch_region(arguments: dict[str, Any]) -> str:
+    """Acknowledge a ``switch_region`` call; the UI performs the switch."""
+    region_val = arguments.get("region")
+    if not region_val:
+        return json.dumps({"error": "Missing required parameter: region."})
+    return json.dumps(
+        {
+            "status": "ok",
+            "region": region_val,
+            "message": f"Switched active region to {region_val}.",
+        }
+    )
+
+
+def _handle_switch_tenant(arguments: dict[str, Any]) -> str:
+    """Acknowledge a ``switch_tenant`` call; the UI performs the switch."""
+    tid = arguments.get("tenant_id")
+    if not tid:
+        return json.dumps({"error": "Missing required parameter: tenant_id."})
+    return json.dumps(
+        {
+            "status": "ok",
+            "tenant_id": tid,
+            "message": f"Switched active tenant to {tid}.",
+        }
+    )
+
+
+# Chat-only tool name → handler returning the JSON result string
+_CHAT_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "switch_region": _handle_switch_region,
+    "switch_tenant": _handle_switch_tenant,
+}
+
+
+def _resolve_tool_call(name: str, arguments: dict[str, Any]) -> tuple[Any, str | None]:
+    """Validate a tool call and return ``(tool, None)`` or ``(None, result)``.
+
+    Chat-only tools (switch_region, switch_tenant), unknown tools and
+    invalid subscription IDs are answered immediately with a JSON result
+    string.  Otherwise the MCP tool object is returned and *arguments* have
+    been normalised in place for the call.
+    """
+    # Chat-only tools (not in MCP server — they control the web UI)
+    handler = _CHAT_TOOL_HANDLERS.get(name)
+    if handler is not None:
+        return None, handler(arguments)
+
+    # MCP-registered tools
+    mcp_tools = _get_mcp_tools()
+    tool = mcp_tools.get(name)
+    if tool is None:
+        return None, json.dumps({"error": f"Unknown tool: {name}"})
+
+    # Pre-validate subscription IDs
+    if "subscription_id" in arguments:
+        err = _validate_subscription_id(arguments["subscription_id"])
+        if err:
+            return None, err
+    if "subscription_ids" in arguments:
+        sub_ids = arguments["subscription_ids"]
+        if isinstance(sub_ids, str):
+            sub_ids = [sub_ids]
+            arguments["subscription_ids"] = sub_ids
+        for sid in sub_ids:
+            err = _validate_subscription_id(sid, "subscription_ids[]")
+            if err:
+                return None, err
+
+    # Coerce single string to list for array parameters
+    if "vm_sizes" in arguments and isinstance(arguments["vm_sizes"], str):
+        arguments["vm_sizes"] = [arguments["vm_sizes"]]
+
+    return tool, None
+
+
+def _tool_error(name: str, exc: Exception) -> str:
+    """Return the JSON error result for a tool call that raised *exc*."""
+    if isinstance(exc, TypeError):
+        # Missing/invalid arguments for the MCP function
+        logger.warning("Tool %s called with bad args: %s", name, exc)
+        return json.dumps({"error": f"Invalid arguments for {name}: {exc}"})
+    logger.exception("Tool execution failed: %s", name)
+    return json.dumps({"error": str(exc)})
+
+
+def _is_error_result(result: str) -> bool:
+    """Return True if *result* is an ``{"error": ...}`` envelope rather than data."""
+    if not result.lstrip().startswith("{"):
+        return False
+    try:
+        parsed = json.loads(result)
+    except ValueError:
+        return False
+    return isinstance(parsed, dict) and "error" in parsed
+
+
 def _execute_tool(name: str, arguments: dict[str, Any]) -> str:
     """Execute a tool by name and return the JSON result string.
 
@@ -94,111 +292,128 @@ def _execute_tool(name: str, arguments: dict[str, Any]) -> str:
     Chat-only tools (switch_region, switch_tenant) are handled locally.
     """
     try:
-        # Chat-only tools (not in MCP server — they control the web UI)
-        if name == "switch_region":
-            region_val = arguments.get("region")
-            if not region_val:
-                return json.dumps({"error": "Missing required parameter: region."})
-            return json.dumps(
-                {
-                    "status": "ok",
-                    "region": region_val,
-                    "message": f"Switched active region to {region_val}.",
-                }
-            )
-
-        if name == "switch_tenant":
-            tid = arguments.get("tenant_id")
-            if not tid:
-                return json.dumps({"error": "Missing required parameter: tenant_id."})
-            return json.dumps(
-                {
-                    "status": "ok",
-                    "tenant_id": tid,
-                    "message": f"Switched active tenant to {tid}.",
-                }
-            )
-
-        # MCP-registered tools
-        mcp_tools = _get_mcp_tools()
-        tool = mcp_tools.get(name)
-        if tool is None:
-            return json.dumps({"error": f"Unknown tool: {name}"})
+        tool, early_result = _resolve_tool_call(name, arguments)
+        if early_result is not None:
+            return early_result
 
-        # Pre-validate subscription IDs
-        if "subscription_id" in arguments:
-            err = _validate_subscription_id(arguments["subscription_id"])
-            if err:
-                return err
-        if "subscription_ids" in arguments:
-            sub_ids = arguments["subscription_ids"]
-            if isinstance(sub_ids, str):
-                sub_ids = [sub_ids]
-                arguments["subscription_ids"] = sub_ids
-            for sid in sub_ids:
-                err = _validate_subscription_id(sid, "subscription_ids[]")
-                if err:
-                    return err
-
-        # Coerce single string to list for array parameters
-        if "vm_sizes" in arguments and isinstance(arguments["vm_sizes"], str):
-            arguments["vm_sizes"] = [arguments["vm_sizes"]]
+        cache_key = _tool_cache_key(name, arguments)
+        if cache_key is not None:
+            cached = _tool_cache_get(cache_key, _TOOL_CACHE_TTL[name])
+            if cached is not None:
+                return cached
 
         # Call the MCP tool function directly
         result = tool.fn(**arguments)
 
         # Apply chat-specific post-processing
-        return _post_process_tool_result(name, arguments, result)
+        result = _post_process_tool_result(name, arguments, result)
+        if cache_key is not None and not _is_error_result(result):
+            _tool_cache_put(cache_key, result)
+        return result
 
-    except TypeError as exc:
-        # Missing/invalid arguments for the MCP function
-        logger.warning("Tool %s called with bad args: %s", name, exc)
-        return json.dumps({"error": f"Invalid arguments for {name}: {exc}"})
     except Exception as exc:
-        logger.exception("Tool execution failed: %s", name)
-        return json.dumps({"error": str(exc)})
+        return _tool_error(name, exc)
+
+
+async def _execute_tool_async(name: str, arguments: dict[str, Any]) -> str:
+    """Async variant of :func:`_execute_tool` for use on the event loop.
+
+    Coroutine tool functions (e.g. from plugins) are awaited directly;
+    synchronous ones run in a worker thread so that Azure API calls made by
+    several tools in the same round can overlap.
+    """
+    tool = _get_mcp_tools().get(name)
+    if tool is None or not inspect.iscoroutinefunction(tool.fn):
+        return await asyncio.to_thread(_execute_tool, name, arguments)
+
+    try:
+        tool, early_result = _resolve_tool_call(name, arguments)
+        if early_result is not None:
+            return early_result
+        result = await tool.fn(**arguments)
+        return _post_process_tool_result(name, arguments, result)
+    except Exception as exc:
+        return _tool_error(name, exc)
+
+
+async def _execute_tool_limited(
+    name: str, arguments: dict[str, Any], slots: asyncio.Semaphore
+) -> str:
+    """Run :func:`_execute_tool_async` once one of *slots* is free.
+
+    The chat loops share one semaphore of ``_MAX_CONCURRENT_TOOLS`` slots
+    per conversation turn, so a model emitting many parallel calls does
+    not fan out into a burst of ARM requests that gets throttled.
+    """
+    async with slots:
+        return await _execute_tool_async(name, arguments)
+
+
+# Tools whose results are rewritten by _post_process_obj(); other results
+# are passed through without being parsed.
+_POST_PROCESSED_TOOLS = frozenset({"get_sku_availability", "get_sku_pricing_detail"})
+
+_PRICE_KEYS = ("paygo", "spot", "ri_1y", "ri_3y", "sp_1y", "sp_3y")
+
+
+def _paygo_sort_key(sku: dict[str, Any]) -> tuple[bool, float]:
+    """Sort key placing the cheapest PAYGO SKUs first and unpriced SKUs last."""
+    paygo = sku.get("pricing", {}).get("paygo")
+    return (paygo is None, paygo or float("inf"))
 
 
 def _post_process_tool_result(name: str, arguments: dict[str, Any], result: str) -> str:
     """Apply chat-specific post-processing to an MCP tool result.
 
+    The result is parsed at most once, rewritten in place by
+    :func:`_post_process_obj` and serialised again only if it changed.
+    """
+    if name not in _POST_PROCESSED_TOOLS:
+        return result
+    if name == "get_sku_availability" and not arguments.get("include_prices"):
+        return result
+    try:
+        data = json.loads(result)
+    except (json.JSONDecodeError, ValueError):
+        return result
+    if _post_process_obj(name, arguments, data):
+        return _compact_json(data)
+    return result
+
+
+def _post_process_obj(name: str, arguments: dict[str, Any], data: Any) -> bool:
+    """Post-process a parsed MCP tool result in place.
+
     - ``get_sku_availability``: sort by PAYGO price ascending so cheapest
       SKUs survive truncation.
     - ``get_sku_pricing_detail``: add a hint when all prices are null to
       guide the AI toward calling ``get_sku_availability`` first.
+
+    Returns True if *data* was modified.
     """
-    if name == "get_sku_availability" and arguments.get("include_prices"):
+    if (
+        name == "get_sku_availability"
+        and arguments.get("include_prices")
+        and isinstance(data, list)
+    ):
         # Sort by PAYGO price ascending so cheapest SKUs survive truncation.
         # SKUs without pricing go last.
-        try:
-            skus = json.loads(result)
-            if isinstance(skus, list):
-                skus.sort(
-                    key=lambda s: (
-                        s.get("pricing", {}).get("paygo") is None,
-                        s.get("pricing", {}).get("paygo") or float("inf"),
-                    )
-                )
-                return json.dumps(skus, indent=2)
-        except (json.JSONDecodeError, ValueError):
-            pass
-
-    if name == "get_sku_pricing_detail":
+        data.sort(key=_paygo_sort_key)
+        return True
+
+    if (
+        name == "get_sku_pricing_detail"
+        and isinstance(data, dict)
+        and all(data.get(k) is None for k in _PRICE_KEYS)
+    ):
         # Add hint when all prices are null to guide the AI
-        try:
-            data = json.loads(result)
-            if isinstance(data, dict):
-                price_keys = ("paygo", "spot", "ri_1y", "ri_3y", "sp_1y", "sp_3y")
-                if all(data.get(k) is None for k in price_keys):
-                    sku_name = arguments.get("sku_name", "unknown")
-                    data["hint"] = (
-                        f"No pricing found for '{sku_name}'. This usually means the "
-                        "sku_name is not an exact ARM name. Call get_sku_availability "
-                        "with a name filter (e.g. name='M128') to discover the correct "
-                        "ARM SKU names (like Standard_M128s_v2), then retry."
-                    )
-                    return json.dumps(data, indent=2)
-        except (json.JSONDecodeError, ValueError):
-            pass
+        sku_name = arguments.get("sku_name", "unknown")
+        data["hint"] = (
+            f"No pricing found for '{sku_name}'. This usually means the "
+            "sku_name is not an exact ARM name. Call get_sku_availability "
+            "with a name filter (e.g. name='M128') to discover the correct "
+            "ARM SKU names (like Standard_M128s_v2), then retry."
+        )
+        return True
 
-    return result
+    return False
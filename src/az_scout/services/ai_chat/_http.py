@@ -0,0 +1,142 @@
+"""Shared HTTP client for Azure OpenAI calls."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool shared by chat_stream() and ai_complete() so TCP/TLS
+# sessions to the Azure OpenAI endpoint are reused across tool-calling
+# rounds and chat turns.
+_MAX_KEEPALIVE_CONNECTIONS = 20
+_MAX_CONNECTIONS = 100
+_KEEPALIVE_EXPIRY = 30.0  # seconds
+_TIMEOUT = 120.0  # seconds
+_CONNECT_TIMEOUT = 10.0  # seconds
+
+# Retry policy for throttled / temporarily unavailable Azure OpenAI calls
+_RETRYABLE_STATUS = frozenset({429, 503})
+_INITIAL_BACKOFF = 1.0  # seconds
+_MAX_BACKOFF = 30.0  # seconds, when no Retry-After header is sent
+_MAX_RETRY_AFTER = 60.0  # seconds, upper bound on a server-requested wait
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+# Closes of clients left behind by an earlier event loop, still running
+_retired_closes: set[asyncio.Task[None]] = set()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared ``httpx.AsyncClient``, creating it on first use.
+
+    Pooled connections are bound to the event loop that opened them, so the
+    client is rebuilt when called from a different loop (e.g. a new
+    ``asyncio.run()`` in the CLI or tests); the client it replaces is closed.
+    """
+    global _client, _client_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            _retire_client(_client, _client_loop)
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(_TIMEOUT, connect=_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=_MAX_CONNECTIONS,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _client_loop = loop
+    return _client
+
+
+def _retire_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close *client*, opened on another event loop, without blocking.
+
+    A loop still running in another thread closes its own client; otherwise
+    the close runs in the background on the current loop and is awaited by
+    :func:`aclose_http_client`.
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    task = asyncio.get_running_loop().create_task(_aclose_quietly(client))
+    _retired_closes.add(task)
+    task.add_done_callback(_retired_closes.discard)
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    """Close *client*, tolerating connections bound to a closed loop."""
+    # Such connections cannot schedule their own teardown; their sockets are
+    # released when garbage collected.
+    with contextlib.suppress(RuntimeError):
+        await client.aclose()
+
+
+def _retry_wait(attempt: int, retry_after: str | None = None) -> float:
+    """Compute the wait before retry *attempt* (0-based).
+
+    Honours a ``Retry-After`` header given either as delta-seconds or as an
+    HTTP date, capped at ``_MAX_RETRY_AFTER``; otherwise falls back to
+    jittered exponential backoff capped at ``_MAX_BACKOFF``.
+    """
+    if retry_after:
+        wait = _parse_retry_after(retry_after.strip())
+        if wait is not None:
+            return min(wait, _MAX_RETRY_AFTER)
+    return float(min(_INITIAL_BACKOFF * 2**attempt + random.random(), _MAX_BACKOFF))
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Return the delay in seconds a ``Retry-After`` value asks for, if valid."""
+    if value.isascii() and value.isdecimal():
+        return float(value)
+    if value[:1].isalpha():
+        with contextlib.suppress(TypeError, ValueError):
+            when = parsedate_to_datetime(value)
+            return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+async def warm_up_http_client(endpoint: str) -> None:
+    """Open a pooled connection to *endpoint* ahead of the first chat turn.
+
+    Sends a cheap ``HEAD`` request so DNS resolution and the TCP/TLS
+    handshake are done before a user waits on them.  The response status
+    is irrelevant and network errors are ignored.
+    """
+    with contextlib.suppress(httpx.HTTPError):
+        await _get_http_client().head(endpoint, timeout=_CONNECT_TIMEOUT)
+        logger.debug("Azure OpenAI connection pre-warmed: %s", endpoint)
+
+
+async def aclose_http_client() -> None:
+    """Close the shared client and any client replaced after a loop change.
+
+    Called from the FastAPI lifespan on shutdown.
+    """
+    global _client, _client_loop  # noqa: PLW0603
+    client, loop = _client, _client_loop
+    _client = None
+    _client_loop = None
+    if client is not None and not client.is_closed:
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+        else:
+            await _aclose_quietly(client)
+    running = asyncio.get_running_loop()
+    pending = [task for task in _retired_closes if task.get_loop() is running]
+    if pending:
+        await asyncio.gather(*pending)
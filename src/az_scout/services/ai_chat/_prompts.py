@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 _RESPONSE_FORMAT_INSTRUCTIONS = """\
 
 Response formatting:
@@ -62,6 +64,53 @@ restrictions in some zones, or the confidence score is below High (< 80).
 """
 
 
+_TENANT_CONTEXT = (
+    "\n\nCurrent tenant context: The user has selected tenant ID "
+    "`{tenant_id}` in the UI. Tool calls will automatically use this "
+    "tenant unless you override with a different `tenant_id` argument."
+)
+_NO_TENANT_CONTEXT = (
+    "\n\nNo tenant is currently selected. If the user needs to query a "
+    "specific tenant, advise them to select one from the tenant dropdown, "
+    "or ask them which tenant they want to use."
+)
+_REGION_CONTEXT = (
+    "\n\nCurrent region context: The user has selected region "
+    "`{region}` in the UI. Tool calls that accept a `region` parameter "
+    "will automatically use this region unless you specify a different one."
+)
+_SUBSCRIPTION_CONTEXT = (
+    "\n\nCurrent subscription context: The user has selected subscription "
+    "ID `{subscription_id}` in the UI. Use this subscription ID for tool "
+    "calls that require a `subscription_id` parameter, unless the user "
+    "explicitly asks you to use a different one."
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _context_suffix(
+    tenant_id: str | None,
+    region: str | None,
+    subscription_id: str | None,
+) -> str:
+    """Return the UI-context and formatting text appended to every system prompt.
+
+    Only depends on the selected tenant / region / subscription, which take
+    a handful of distinct values per session, so the result is memoised.
+    The base prompt is not cached: it depends on plugins, which can be
+    reloaded at runtime.
+    """
+    parts = [
+        _TENANT_CONTEXT.format(tenant_id=tenant_id) if tenant_id else _NO_TENANT_CONTEXT,
+    ]
+    if region:
+        parts.append(_REGION_CONTEXT.format(region=region))
+    if subscription_id:
+        parts.append(_SUBSCRIPTION_CONTEXT.format(subscription_id=subscription_id))
+    parts.append(_RESPONSE_FORMAT_INSTRUCTIONS)
+    return "".join(parts)
+
+
 def _build_system_prompt(
     tenant_id: str | None = None,
     region: str | None = None,
@@ -83,30 +132,4 @@ def _build_system_prompt(
 
         plugin_modes = get_plugin_chat_modes()
         prompt = plugin_modes[mode].system_prompt if mode in plugin_modes else SYSTEM_PROMPT
-    if tenant_id:
-        prompt += (
-            f"\n\nCurrent tenant context: The user has selected tenant ID "
-            f"`{tenant_id}` in the UI. Tool calls will automatically use this "
-            f"tenant unless you override with a different `tenant_id` argument."
-        )
-    else:
-        prompt += (
-            "\n\nNo tenant is currently selected. If the user needs to query a "
-            "specific tenant, advise them to select one from the tenant dropdown, "
-            "or ask them which tenant they want to use."
-        )
-    if region:
-        prompt += (
-            f"\n\nCurrent region context: The user has selected region "
-            f"`{region}` in the UI. Tool calls that accept a `region` parameter "
-            f"will automatically use this region unless you specify a different one."
-        )
-    if subscription_id:
-        prompt += (
-            f"\n\nCurrent subscription context: The user has selected subscription "
-            f"ID `{subscription_id}` in the UI. Use this subscription ID for tool "
-            f"calls that require a `subscription_id` parameter, unless the user "
-            f"explicitly asks you to use a different one."
-        )
-    prompt += _RESPONSE_FORMAT_INSTRUCTIONS
-    return prompt
+    return prompt + _context_suffix(tenant_id, region, subscription_id)
@@ -3,25 +3,33 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import json
 import logging
+import time
 from collections.abc import AsyncGenerator
+from json.encoder import encode_basestring_ascii as _encode_json_str
 from typing import Any
 
+import httpx
+
 from az_scout.services.ai_chat._config import (
     AZURE_OPENAI_API_KEY,
-    AZURE_OPENAI_API_VERSION,
-    AZURE_OPENAI_DEPLOYMENT,
-    AZURE_OPENAI_ENDPOINT,
+    AZURE_OPENAI_CHAT_URL,
+    CHAT_DELTA_COALESCE_MS,
 )
 from az_scout.services.ai_chat._dispatch import (
-    _execute_tool,
-    _get_tool_params,
+    _MAX_CONCURRENT_TOOLS,
+    _execute_tool_limited,
+    _inject_context,
     _truncate_tool_result,
 )
+from az_scout.services.ai_chat._http import (
+    _RETRYABLE_STATUS,
+    _get_http_client,
+    _retry_wait,
+)
 from az_scout.services.ai_chat._prompts import _build_system_prompt
-from az_scout.services.ai_chat._tools import TOOL_DEFINITIONS
+from az_scout.services.ai_chat._tools import _chat_request_body
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +38,14 @@ _MAX_TOOL_ROUNDS = 10
 
 # Retry config for Azure OpenAI 429 rate-limit errors
 _MAX_RETRIES = 3
-_DEFAULT_RETRY_WAIT = 10  # seconds when no Retry-After header
 
 # Maximum characters sent to the frontend UI for tool result inspection.
 # Larger than the summary (200 chars) but smaller than the LLM context budget.
 _MAX_TOOL_UI_CHARS = 10_000
 
+# Coalesced text is flushed early once this many characters are pending
+_COALESCE_MAX_CHARS = 256
+
 
 async def chat_stream(
     messages: list[dict[str, Any]],
@@ -51,14 +61,14 @@ async def chat_stream(
 
     Each data payload is one of:
     - ``{"type": "delta", "content": "..."}``  – streamed text chunk
-    - ``{"type": "tool_call", "name": "...", "arguments": "..."}``  – tool invocation info
-    - ``{"type": "tool_result", "name": "...", "arguments": "...", "content": "..."}``
-      – tool result with I/O data for UI inspection
+    - ``{"type": "tool_call", "tool_call_id": "...", "name": "...", "arguments": "..."}``
+      – tool invocation info
+    - ``{"type": "tool_result", "tool_call_id": "...", "name": "...", "arguments": "...",
+      "content": "..."}`` – tool result with I/O data for UI inspection; results
+      arrive in completion order, ``tool_call_id`` matches them to their call
     - ``{"type": "error", "content": "..."}``  – error
     - ``{"type": "done"}``  – stream finished
     """
-    import httpx
-
     full_messages: list[dict[str, Any]] = [
         {
             "role": "system",
@@ -67,198 +77,175 @@ async def chat_stream(
         *messages,
     ]
 
-    url = (
-        f"{AZURE_OPENAI_ENDPOINT.rstrip('/')}/openai/deployments/"
-        f"{AZURE_OPENAI_DEPLOYMENT}/chat/completions"
-        f"?api-version={AZURE_OPENAI_API_VERSION}"
-    )
+    url = AZURE_OPENAI_CHAT_URL
     headers = {
         "Content-Type": "application/json",
         "api-key": AZURE_OPENAI_API_KEY,
     }
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        for _round in range(_MAX_TOOL_ROUNDS):
-            body = {
-                "messages": full_messages,
-                "tools": TOOL_DEFINITIONS,
-                "tool_choice": "auto",
-                "stream": True,
-            }
+    tool_slots = asyncio.Semaphore(_MAX_CONCURRENT_TOOLS)
+    client = _get_http_client()
+    for _round in range(_MAX_TOOL_ROUNDS):
+        content_parts: list[str] = []
+        # Built directly in the shape the assistant message needs
+        tool_calls: dict[int, dict[str, Any]] = {}
+        # Argument fragments are joined once a call is complete rather than
+        # re-concatenated on every delta.
+        tool_args: dict[int, list[str]] = {}
+        finish_reason: str | None = None
+
+        request = client.build_request(
+            "POST",
+            url,
+            content=_chat_request_body(full_messages, stream=True),
+            headers=headers,
+        )
+
+        try:
+            # Retry loop for 429 / 503 responses
+            for _attempt in range(_MAX_RETRIES):
+                resp = await client.send(request, stream=True)
+                if resp.status_code in _RETRYABLE_STATUS:
+                    # Read and release the connection before waiting
+                    error_body = await resp.aread()
+                    await resp.aclose()
+                    if _attempt < _MAX_RETRIES - 1:
+                        wait = _retry_wait(_attempt, resp.headers.get("retry-after"))
+                        logger.warning(
+                            "Azure OpenAI %s, retrying in %.1fs (attempt %s/%s)",
+                            resp.status_code,
+                            wait,
+                            _attempt + 1,
+                            _MAX_RETRIES,
+                        )
+                        reason = (
+                            "Rate limited" if resp.status_code == 429 else "Service unavailable"
+                        )
+                        yield _sse(
+                            {
+                                "type": "status",
+                                "content": f"{reason} — retrying in {wait:.0f}s…",
+                            }
+                        )
+                        await asyncio.sleep(wait)
+                        continue
+                    # Last attempt still throttled — surface error
+                    yield _sse({"type": "error", "content": error_body.decode()})
+                    yield _SSE_DONE
+                    return
+                elif resp.status_code != 200:
+                    error_body = await resp.aread()
+                    await resp.aclose()
+                    yield _sse({"type": "error", "content": error_body.decode()})
+                    yield _SSE_DONE
+                    return
+                else:
+                    break
 
             try:
-                # Retry loop for 429 rate-limit errors
-                resp_ctx = None
-                for _attempt in range(_MAX_RETRIES):
-                    resp_ctx = client.stream(
-                        "POST",
-                        url,
-                        json=body,
-                        headers=headers,
-                    )
-                    resp = await resp_ctx.__aenter__()
-                    if resp.status_code == 429:
-                        error_body = await resp.aread()
-                        await resp_ctx.__aexit__(None, None, None)
-                        retry_after = _DEFAULT_RETRY_WAIT
-                        if resp.headers.get("retry-after"):
-                            with contextlib.suppress(TypeError, ValueError):
-                                retry_after = int(resp.headers["retry-after"])
-                        if _attempt < _MAX_RETRIES - 1:
-                            logger.warning(
-                                "Azure OpenAI 429, retrying in %ss (attempt %s/%s)",
-                                retry_after,
-                                _attempt + 1,
-                                _MAX_RETRIES,
-                            )
-                            yield _sse(
-                                {
-                                    "type": "status",
-                                    "content": (f"Rate limited — retrying in {retry_after}s…"),
-                                }
-                            )
-                            await asyncio.sleep(retry_after)
-                            continue
-                        # Last attempt still 429 — surface error
-                        yield _sse({"type": "error", "content": error_body.decode()})
-                        yield _sse({"type": "done"})
-                        return
-                    elif resp.status_code != 200:
-                        error_body = await resp.aread()
-                        await resp_ctx.__aexit__(None, None, None)
-                        yield _sse({"type": "error", "content": error_body.decode()})
-                        yield _sse({"type": "done"})
-                        return
-                    else:
-                        break
-
-                assert resp_ctx is not None  # for type checker
-
-                try:
-                    # Accumulate streamed response
-                    content_parts: list[str] = []
-                    tool_calls: dict[int, dict[str, str]] = {}
-                    finish_reason: str | None = None
-
-                    async for line in resp.aiter_lines():
-                        if not line.startswith("data: "):
-                            continue
-                        data_str = line[6:]
-                        if data_str.strip() == "[DONE]":
-                            break
-
-                        try:
-                            chunk = json.loads(data_str)
-                        except json.JSONDecodeError:
-                            continue
-
-                        choices = chunk.get("choices", [])
-                        if not choices:
-                            continue
-                        delta = choices[0].get("delta", {})
-                        finish_reason = choices[0].get("finish_reason") or finish_reason
-
-                        # Text content
-                        if delta.get("content"):
-                            content_parts.append(delta["content"])
-                            yield _sse({"type": "delta", "content": delta["content"]})
-
-                        # Tool calls (streamed incrementally)
-                        for tc in delta.get("tool_calls", []):
-                            idx = tc["index"]
-                            if idx not in tool_calls:
-                                tool_calls[idx] = {
-                                    "id": tc.get("id", ""),
-                                    "name": tc.get("function", {}).get("name", ""),
-                                    "arguments": "",
-                                }
-                            if tc.get("id"):
-                                tool_calls[idx]["id"] = tc["id"]
-                            if tc.get("function", {}).get("name"):
-                                tool_calls[idx]["name"] = tc["function"]["name"]
-                            if tc.get("function", {}).get("arguments"):
-                                tool_calls[idx]["arguments"] += tc["function"]["arguments"]
-                finally:
-                    await resp_ctx.__aexit__(None, None, None)
-
-            except httpx.HTTPError as exc:
-                yield _sse({"type": "error", "content": f"HTTP error: {exc}"})
-                yield _sse({"type": "done"})
-                return
-
-            # If no tool calls, we're done
-            if finish_reason != "tool_calls" or not tool_calls:
-                yield _sse({"type": "done"})
-                return
-
-            # Execute tool calls and continue the conversation
-            assistant_msg: dict[str, Any] = {"role": "assistant"}
-            full_content = "".join(content_parts)
-            if full_content:
-                assistant_msg["content"] = full_content
-            assistant_msg["tool_calls"] = [
-                {
-                    "id": tc["id"],
-                    "type": "function",
-                    "function": {"name": tc["name"], "arguments": tc["arguments"]},
-                }
-                for tc in tool_calls.values()
-            ]
-            full_messages.append(assistant_msg)
-
-            for tc in tool_calls.values():
-                tool_name = tc["name"]
-                try:
-                    args = json.loads(tc["arguments"]) if tc["arguments"] else {}
-                except json.JSONDecodeError:
-                    args = {}
+                # Accumulate streamed response
+                coalescer = _DeltaCoalescer(CHAT_DELTA_COALESCE_MS)
 
-                yield _sse(
-                    {
-                        "type": "tool_call",
-                        "name": tool_name,
-                        "arguments": json.dumps(args),
-                    }
-                )
+                async for data in _iter_sse_data(resp):
+                    if data.strip() == b"[DONE]":
+                        break
 
-                # Auto-inject tenant_id and region if not explicitly specified
-                if tenant_id and "tenant_id" in _get_tool_params(tool_name):
-                    args.setdefault("tenant_id", tenant_id)
-                if region and "region" in _get_tool_params(tool_name):
-                    args.setdefault("region", region)
-                if subscription_id:
-                    if "subscription_id" in _get_tool_params(tool_name):
-                        args.setdefault("subscription_id", subscription_id)
-                    if "subscription_ids" in _get_tool_params(tool_name):
-                        args.setdefault("subscription_ids", [subscription_id])
-
-                # In planner mode, always include pricing data
-                if mode == "planner" and tool_name == "get_sku_availability":
-                    args.setdefault("include_prices", True)
-
-                # Emit UI actions for switch tools before executing
-                if tool_name == "switch_tenant" and args.get("tenant_id"):
-                    yield _sse(
-                        {
-                            "type": "ui_action",
-                            "action": "switch_tenant",
-                            "tenant_id": args["tenant_id"],
-                        }
-                    )
-                    # Update tenant_id for subsequent tool calls in this stream
-                    tenant_id = args["tenant_id"]
-                elif tool_name == "switch_region" and args.get("region"):
-                    yield _sse(
-                        {
-                            "type": "ui_action",
-                            "action": "switch_region",
-                            "region": args["region"],
-                        }
-                    )
-                    # Update region for subsequent tool calls in this stream
-                    region = args["region"]
-
-                result = _execute_tool(tool_name, args)
+                    try:
+                        chunk = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+
+                    choices = chunk.get("choices")
+                    if not choices:
+                        continue
+                    choice = choices[0]
+                    delta = choice.get("delta") or _EMPTY
+                    if reason := choice.get("finish_reason"):
+                        finish_reason = reason
+
+                    # Text content
+                    if content := delta.get("content"):
+                        content_parts.append(content)
+                        if frame := coalescer.add(content):
+                            yield frame
+
+                    # Tool calls (streamed incrementally)
+                    tool_call_deltas = delta.get("tool_calls")
+                    if tool_call_deltas and (frame := coalescer.flush()):
+                        yield frame
+                    for tc in tool_call_deltas or ():
+                        idx = tc["index"]
+                        fn = tc.get("function") or _EMPTY
+                        call = tool_calls.get(idx)
+                        if call is None:
+                            call = tool_calls[idx] = {
+                                "id": "",
+                                "type": "function",
+                                "function": {"name": "", "arguments": ""},
+                            }
+                            tool_args[idx] = []
+                        if tc.get("id"):
+                            call["id"] = tc["id"]
+                        if fn.get("name"):
+                            call["function"]["name"] = fn["name"]
+                        if fn.get("arguments"):
+                            tool_args[idx].append(fn["arguments"])
+
+                if frame := coalescer.flush():
+                    yield frame
+            finally:
+                await resp.aclose()
+
+        except httpx.HTTPError as exc:
+            yield _sse({"type": "error", "content": f"HTTP error: {exc}"})
+            yield _SSE_DONE
+            return
+
+        # If no tool calls, we're done
+        if finish_reason != "tool_calls" or not tool_calls:
+            yield _SSE_DONE
+            return
+
+        # Prepare the calls in model order (switch tools change the context
+        # for the calls that follow them) and announce them before any runs.
+        prepared: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        frames: list[str] = []
+        for idx, tc in tool_calls.items():
+            tc["function"]["arguments"] = "".join(tool_args[idx])
+            args, call_frames = _prepare_tool_call(
+                tc,
+                tenant_id=tenant_id,
+                region=region,
+                subscription_id=subscription_id,
+                mode=mode,
+            )
+            frames += call_frames
+            tool_name = tc["function"]["name"]
+            if tool_name == "switch_tenant" and args.get("tenant_id"):
+                tenant_id = args["tenant_id"]
+            elif tool_name == "switch_region" and args.get("region"):
+                region = args["region"]
+            prepared.append((tc, args))
+        for frame in frames:
+            yield frame
+
+        assistant_msg: dict[str, Any] = {"role": "assistant"}
+        full_content = "".join(content_parts)
+        if full_content:
+            assistant_msg["content"] = full_content
+        assistant_msg["tool_calls"] = list(tool_calls.values())
+        full_messages.append(assistant_msg)
+
+        # Results reach the UI as soon as each call finishes; the tool
+        # messages are appended in model order once the round is complete.
+        tasks = [
+            asyncio.create_task(_execute_tool_limited(tc["function"]["name"], args, tool_slots))
+            for tc, args in prepared
+        ]
+        tool_contents = [""] * len(prepared)
+        try:
+            async for i, result in _iter_tool_results(tasks):
+                tc, args = prepared[i]
 
                 # Send result to the UI for tool inspection
                 ui_content = (
@@ -269,27 +256,193 @@ async def chat_stream(
                 yield _sse(
                     {
                         "type": "tool_result",
-                        "name": tool_name,
+                        "tool_call_id": tc["id"],
+                        "name": tc["function"]["name"],
                         "arguments": json.dumps(args),
                         "content": ui_content,
                     }
                 )
 
                 # Truncate large tool results to avoid blowing up the context
-                tool_content = _truncate_tool_result(result)
+                tool_contents[i] = _truncate_tool_result(result)
+        finally:
+            # The client may disconnect while results are pending
+            for task in tasks:
+                task.cancel()
+
+        # Only the truncated copies are needed from here on; release the full
+        # outputs before the next model call streams in.
+        del result, ui_content, tasks
+
+        for (tc, _args), tool_content in zip(prepared, tool_contents, strict=True):
+            full_messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tc["id"],
+                    "content": tool_content,
+                }
+            )
 
-                full_messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tc["id"],
-                        "content": tool_content,
-                    }
-                )
+    # If we exhausted rounds, signal done
+    yield _SSE_DONE
+
+
+def _prepare_tool_call(
+    tc: dict[str, Any],
+    *,
+    tenant_id: str | None,
+    region: str | None,
+    subscription_id: str | None,
+    mode: str,
+) -> tuple[dict[str, Any], list[str]]:
+    """Parse and complete the arguments of a streamed tool call.
+
+    Returns the arguments to execute the tool with and the SSE frames
+    announcing the call (plus the UI action for switch tools).
+    """
+    tool_name = tc["function"]["name"]
+    # The model's argument string is echoed to the UI as-is once it
+    # parses; only unparseable arguments are replaced.
+    raw_args = tc["function"]["arguments"] or "{}"
+    try:
+        args = json.loads(raw_args)
+    except json.JSONDecodeError:
+        args = {}
+        raw_args = "{}"
+
+    frames = [
+        _sse(
+            {
+                "type": "tool_call",
+                "tool_call_id": tc["id"],
+                "name": tool_name,
+                "arguments": raw_args,
+            }
+        )
+    ]
+
+    # Auto-inject context parameters if not explicitly specified
+    _inject_context(
+        tool_name,
+        args,
+        tenant_id=tenant_id,
+        region=region,
+        subscription_id=subscription_id,
+    )
+
+    # In planner mode, always include pricing data
+    if mode == "planner" and tool_name == "get_sku_availability":
+        args.setdefault("include_prices", True)
+
+    # Emit UI actions for switch tools before executing
+    if tool_name == "switch_tenant" and args.get("tenant_id"):
+        frames.append(
+            _sse({"type": "ui_action", "action": "switch_tenant", "tenant_id": args["tenant_id"]})
+        )
+    elif tool_name == "switch_region" and args.get("region"):
+        frames.append(
+            _sse({"type": "ui_action", "action": "switch_region", "region": args["region"]})
+        )
+    return args, frames
+
+
+async def _iter_tool_results(
+    tasks: list[asyncio.Task[str]],
+) -> AsyncGenerator[tuple[int, str], None]:
+    """Yield ``(index, result)`` for each tool task as it finishes."""
+    order = {task: i for i, task in enumerate(tasks)}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=order.__getitem__):
+                yield order[task], task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class _DeltaCoalescer:
+    """Merge streamed text fragments into fewer delta frames.
+
+    Azure OpenAI streams a few characters per chunk; with a non-zero
+    *window_ms* fragments are held until the window elapses or
+    ``_COALESCE_MAX_CHARS`` are pending, trading a few milliseconds of
+    latency for far fewer writes to the client.  The window is checked as
+    chunks arrive, so callers must :meth:`flush` when the stream pauses for
+    other output or ends.
+    """
+
+    def __init__(self, window_ms: float) -> None:
+        self._window = window_ms / 1000
+        self._parts: list[str] = []
+        self._size = 0
+        self._deadline = 0.0
+
+    def add(self, content: str) -> str | None:
+        """Queue *content*; return a frame when it is time to send one."""
+        if self._window <= 0:
+            return _sse_delta(content)
+        if not self._parts:
+            self._deadline = time.monotonic() + self._window
+        self._parts.append(content)
+        self._size += len(content)
+        if self._size >= _COALESCE_MAX_CHARS or time.monotonic() >= self._deadline:
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        """Return a frame for any pending text, or None."""
+        if not self._parts:
+            return None
+        frame = _sse_delta("".join(self._parts))
+        self._parts.clear()
+        self._size = 0
+        return frame
+
+
+async def _iter_sse_data(resp: httpx.Response) -> AsyncGenerator[bytes, None]:
+    """Yield the payload of each ``data:`` line of an SSE response.
+
+    Works on raw bytes so lines are split without decoding the whole body
+    to text first; ``json.loads`` accepts the UTF-8 payload directly.
+    """
+    buf = b""
+    async for raw in resp.aiter_bytes():
+        lines = (buf + raw).split(b"\n")
+        buf = lines.pop()
+        for line in lines:
+            data = line.removeprefix(b"data: ")
+            if data is not line:
+                yield data.rstrip(b"\r")
+    data = buf.removeprefix(b"data: ")
+    if data is not buf:
+        yield data.rstrip(b"\r")
 
-        # If we exhausted rounds, signal done
-        yield _sse({"type": "done"})
+
+# Constant envelope around every streamed text delta
+_DELTA_PREFIX = 'data: {"type": "delta", "content": '
+_DELTA_SUFFIX = "}\n\n"
 
 
 def _sse(data: dict[str, Any]) -> str:
     """Format a dict as an SSE data line."""
     return f"data: {json.dumps(data)}\n\n"
+
+
+def _sse_delta(content: str) -> str:
+    """Format a text delta as an SSE data line.
+
+    Same output as ``_sse({"type": "delta", "content": content})`` without
+    building and walking a dict for every streamed token: the envelope is a
+    constant and only the string itself goes through the C string encoder
+    that ``json.dumps`` uses.
+    """
+    return _DELTA_PREFIX + _encode_json_str(content) + _DELTA_SUFFIX
+
+
+# Pre-formatted terminal event
+_SSE_DONE = _sse({"type": "done"})
+
+# Shared read-only stand-in for absent ``delta`` / ``function`` objects
+_EMPTY: dict[str, Any] = {}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 from az_scout.mcp_server import mcp as _mcp_server
@@ -127,8 +128,66 @@ def _build_openai_tools() -> list[dict[str, Any]]:
     return tools
 
 
+def _index_tool_params(tools: list[dict[str, Any]]) -> dict[str, frozenset[str]]:
+    """Map each tool name to the set of its parameter names."""
+    return {
+        t["function"]["name"]: frozenset(t["function"]["parameters"].get("properties", {}))
+        for t in tools
+    }
+
+
+# Parameters the chat loops fill from the UI context when the model omits them
+_CONTEXT_PARAMS = ("tenant_id", "region", "subscription_id", "subscription_ids")
+
+
+def _index_context_params(
+    tool_params: dict[str, frozenset[str]],
+) -> dict[str, tuple[str, ...]]:
+    """Map each tool taking context parameters to the ones it accepts."""
+    return {
+        name: plan
+        for name, params in tool_params.items()
+        if (plan := tuple(p for p in _CONTEXT_PARAMS if p in params))
+    }
+
+
 TOOL_DEFINITIONS: list[dict[str, Any]] = _build_openai_tools()
 
+# Parameter names per tool, kept in sync with TOOL_DEFINITIONS so the
+# context-injection checks in the chat loops are dict lookups.
+_TOOL_PARAMS: dict[str, frozenset[str]] = _index_tool_params(TOOL_DEFINITIONS)
+_TOOL_CONTEXT_PARAMS: dict[str, tuple[str, ...]] = _index_context_params(_TOOL_PARAMS)
+
+
+# JSON encoding of TOOL_DEFINITIONS, reused in every chat request body.
+_tool_definitions_json: str | None = None
+
+
+def _encode_json(obj: Any) -> str:
+    """Encode *obj* the way httpx encodes ``json=`` request bodies."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+def _chat_request_body(
+    messages: list[dict[str, Any]], *, tools: bool = True, stream: bool = False
+) -> bytes:
+    """Encode a chat completions request body.
+
+    The tool schemas do not change between requests, so their JSON is
+    encoded once and spliced in instead of being re-serialised for every
+    round and retry.
+    """
+    global _tool_definitions_json  # noqa: PLW0603
+    parts = ['{"messages":', _encode_json(messages)]
+    if tools and TOOL_DEFINITIONS:
+        if _tool_definitions_json is None:
+            _tool_definitions_json = _encode_json(TOOL_DEFINITIONS)
+        parts += [',"tools":', _tool_definitions_json, ',"tool_choice":"auto"']
+    if stream:
+        parts.append(',"stream":true')
+    parts.append("}")
+    return "".join(parts).encode()
+
 
 def refresh_tool_definitions() -> None:
     """Rebuild TOOL_DEFINITIONS after plugins have registered MCP tools.
@@ -136,7 +195,12 @@ def refresh_tool_definitions() -> None:
     Called by :func:`az_scout.plugins.register_plugins` so that plugin tools
     become available to the AI chat assistant.
     """
-    global _mcp_tool_registry  # noqa: PLW0603
+    global _mcp_tool_registry, _tool_definitions_json  # noqa: PLW0603
     _mcp_tool_registry = None  # invalidate cache so _get_mcp_tools() re-reads
+    _tool_definitions_json = None
     TOOL_DEFINITIONS.clear()
     TOOL_DEFINITIONS.extend(_build_openai_tools())
+    _TOOL_PARAMS.clear()
+    _TOOL_PARAMS.update(_index_tool_params(TOOL_DEFINITIONS))
+    _TOOL_CONTEXT_PARAMS.clear()
+    _TOOL_CONTEXT_PARAMS.update(_index_context_params(_TOOL_PARAMS))
@@ -394,10 +394,10 @@ async function sendChatMessage() {
                     assistantBubble.closest(".chat-message")?.classList.remove("is-thinking");
                     _scrollChatBottom();
                 } else if (payload.type === "tool_call") {
-                    _appendToolStatus(assistantBubble.closest(".chat-message"), payload.name, "calling", payload.arguments);
+                    _appendToolStatus(assistantBubble.closest(".chat-message"), payload.name, "calling", payload.arguments, payload.tool_call_id);
                     _scrollChatBottom();
                 } else if (payload.type === "tool_result") {
-                    _updateToolStatus(assistantBubble.closest(".chat-message"), payload.name, "done", payload.arguments, payload.content);
+                    _updateToolStatus(assistantBubble.closest(".chat-message"), payload.name, "done", payload.arguments, payload.content, payload.tool_call_id);
                     _scrollChatBottom();
                 } else if (payload.type === "ui_action") {
                     _handleChatUiAction(payload);
@@ -520,7 +520,7 @@ function _navigateChatHistory(direction, e) {
     input.setSelectionRange(input.value.length, input.value.length);
 }
 
-function _appendToolStatus(msgDiv, toolName, _status, argsJson) {
+function _appendToolStatus(msgDiv, toolName, _status, argsJson, toolCallId) {
     let toolsDiv = msgDiv.querySelector(".chat-tool-calls");
     if (!toolsDiv) {
         toolsDiv = document.createElement("div");
@@ -532,6 +532,7 @@ function _appendToolStatus(msgDiv, toolName, _status, argsJson) {
     const badge = document.createElement("span");
     badge.className = "chat-tool-badge calling";
     badge.dataset.tool = toolName;
+    if (toolCallId) badge.dataset.toolCallId = toolCallId;
     const friendlyName = toolName.replace(/_/g, " ");
     badge.innerHTML = `<i class="bi bi-gear-fill spin"></i> ${escapeHtml(friendlyName)}`;
     // Store arguments for later inspection
@@ -541,8 +542,12 @@ function _appendToolStatus(msgDiv, toolName, _status, argsJson) {
     toolsDiv.appendChild(badge);
 }
 
-function _updateToolStatus(msgDiv, toolName, status, argsJson, contentStr) {
-    const badge = msgDiv.querySelector(`.chat-tool-badge[data-tool="${toolName}"]`);
+function _updateToolStatus(msgDiv, toolName, status, argsJson, contentStr, toolCallId) {
+    // Results arrive in completion order: match them to their call by id, and
+    // otherwise to the first badge of that tool still waiting for a result.
+    const badge = toolCallId
+        ? msgDiv.querySelector(`.chat-tool-badge[data-tool-call-id="${CSS.escape(toolCallId)}"]`)
+        : msgDiv.querySelector(`.chat-tool-badge.calling[data-tool="${CSS.escape(toolName)}"]`);
     if (!badge) return;
     badge.className = `chat-tool-badge ${status}`;
     const friendlyName = toolName.replace(/_/g, " ");
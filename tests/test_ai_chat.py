@@ -1,6 +1,7 @@
 """Tests for the AI chat service – planner mode, mode switching, MCP tool conversion."""
 
 import json
+from contextlib import contextmanager
 from unittest.mock import patch
 
 from az_scout.internal_plugins.planner.chat_mode import PLANNER_CHAT_MODE
@@ -81,11 +82,32 @@ class TestBuildSystemPrompt:
         assert "virtual machine" in prompt
         assert "Spot" in prompt
 
+    def test_planner_prompt_has_no_duplicated_guidelines(self):
+        """Rules from the shared formatting suffix should appear only once."""
+        with patch(
+            "az_scout.plugins.get_plugin_chat_modes",
+            return_value={"planner": PLANNER_CHAT_MODE},
+        ):
+            prompt = _build_system_prompt(mode="planner")
+        assert prompt.count("Subscription resolution") == 1
+        assert prompt.count("[[option text]]") == 1
+
     def test_assistant_prompt_contains_guidelines(self):
         prompt = _build_system_prompt()
         assert "Interactive choices" in prompt
         assert "Subscription resolution" in prompt
 
+    def test_plugin_addenda_not_cached_with_context(self):
+        """The memoised context suffix must not freeze plugin-dependent text."""
+        _build_system_prompt(tenant_id="tid-123")
+        with patch(
+            "az_scout.plugins.get_plugin_system_prompt_addenda",
+            return_value=["Late plugin guidance."],
+        ):
+            prompt = _build_system_prompt(tenant_id="tid-123")
+        assert "Late plugin guidance." in prompt
+        assert "tid-123" in prompt
+
 
 # ---------------------------------------------------------------------------
 # POST /api/chat  – mode parameter
@@ -174,12 +196,31 @@ class TestTruncateToolResult:
         assert "omitted" in truncated
         assert "total: 3000" in truncated
 
+    def test_truncated_array_is_compact_json_within_budget(self):
+        items = [
+            {"name": f"Standard_D{i}s_v5", "zones": ["1", "2"], "capabilities": {"v": i}}
+            for i in range(5000)
+        ]
+        truncated = _truncate_tool_result(json.dumps(items))
+        body = truncated.split("\n\n// ", 1)[0]
+        kept = json.loads(body)
+        assert kept == items[: len(kept)]
+        assert body == json.dumps(kept, separators=(",", ":"))
+        assert len(body) <= 150_000
+
     def test_large_string_truncated(self):
         result = "x" * 200_000  # above 150k limit
         truncated = _truncate_tool_result(result)
         assert len(truncated) <= 150_100  # budget + "(truncated)"
         assert "truncated" in truncated
 
+    def test_large_object_truncated_without_parsing(self):
+        result = json.dumps({"blob": "x" * 200_000})
+        with patch("az_scout.services.ai_chat._dispatch.json.loads") as loads:
+            truncated = _truncate_tool_result(result)
+        loads.assert_not_called()
+        assert truncated == result[:150_000] + "\n… (truncated)"
+
     def test_small_array_unchanged(self):
         items = [{"name": "Standard_D2s_v5"}]
         result = json.dumps(items, indent=2)
@@ -309,6 +350,45 @@ class TestMcpToOpenaiConversion:
         prices_desc = sku_tool["function"]["parameters"]["properties"]["include_prices"]
         assert "description" in prices_desc
 
+    def test_tool_params_index_matches_definitions(self):
+        from az_scout.services.ai_chat._dispatch import _get_tool_params
+
+        for tool in TOOL_DEFINITIONS:
+            fn = tool["function"]
+            assert _get_tool_params(fn["name"]) == set(fn["parameters"]["properties"])
+        assert _get_tool_params("no_such_tool") == frozenset()
+
+    def test_inject_context_fills_accepted_params_only(self):
+        from az_scout.services.ai_chat import _dispatch
+
+        plan = {"tool_a": ("tenant_id", "subscription_ids"), "tool_b": ("region",)}
+        with patch.dict(_dispatch._TOOL_CONTEXT_PARAMS, plan, clear=True):
+            args: dict = {"tenant_id": "explicit"}
+            _dispatch._inject_context(
+                "tool_a", args, tenant_id="ctx", region="westeurope", subscription_id="sub"
+            )
+            assert args == {"tenant_id": "explicit", "subscription_ids": ["sub"]}
+
+            args = {}
+            _dispatch._inject_context(
+                "tool_b", args, tenant_id="ctx", region=None, subscription_id=None
+            )
+            assert args == {}
+
+            args = {}
+            _dispatch._inject_context(
+                "tool_c", args, tenant_id="ctx", region="westeurope", subscription_id="sub"
+            )
+            assert args == {}
+
+    def test_context_params_index_matches_definitions(self):
+        from az_scout.services.ai_chat._tools import _CONTEXT_PARAMS, _TOOL_CONTEXT_PARAMS
+
+        for tool in TOOL_DEFINITIONS:
+            fn = tool["function"]
+            expected = tuple(p for p in _CONTEXT_PARAMS if p in fn["parameters"]["properties"])
+            assert _TOOL_CONTEXT_PARAMS.get(fn["name"], ()) == expected
+
     def test_every_tool_has_valid_structure(self):
         """All tools should have the correct structure for OpenAI function calling."""
         for tool in TOOL_DEFINITIONS:
@@ -398,6 +478,15 @@ class TestPostProcessToolResult:
         result = _post_process_tool_result("list_tenants", {}, original)
         assert result == original
 
+    def test_unchanged_result_not_reserialized(self):
+        """A result that needs no rewrite should be returned as-is."""
+        from az_scout.services.ai_chat._dispatch import _post_process_obj
+
+        data = {"paygo": 0.1, "spot": None}
+        original = json.dumps(data)
+        assert _post_process_obj("get_sku_pricing_detail", {}, data) is False
+        assert _post_process_tool_result("get_sku_pricing_detail", {}, original) is original
+
 
 # ---------------------------------------------------------------------------
 # POST /api/ai/complete  – non-streaming completion endpoint
@@ -434,3 +523,773 @@ class TestAiCompleteEndpoint:
         )
         # 503 expected since AI is not configured in tests
         assert resp.status_code == 503
+
+
+# ---------------------------------------------------------------------------
+# Subscription ID validation
+# ---------------------------------------------------------------------------
+
+
+class TestValidateSubscriptionId:
+    """Tests for the subscription UUID pre-check on tool arguments."""
+
+    def test_valid_uuid_accepted(self):
+        from az_scout.services.ai_chat._dispatch import _validate_subscription_id
+
+        assert _validate_subscription_id("0123ABCD-4567-89ab-cdef-0123456789ab") is None
+        assert _validate_subscription_id(None) is None
+
+    def test_invalid_values_rejected(self):
+        from az_scout.services.ai_chat._dispatch import _validate_subscription_id
+
+        for value in (
+            "contoso-prod",
+            "0123abcd-4567-89ab-cdef-0123456789ab\n",
+            "0123abcd-4567-89ab-cdef-0123456789zz",
+        ):
+            err = _validate_subscription_id(value)
+            assert err is not None
+            assert "must be a subscription UUID" in json.loads(err)["error"]
+
+
+# ---------------------------------------------------------------------------
+# Async tool execution
+# ---------------------------------------------------------------------------
+
+
+class TestExecuteToolAsync:
+    """Tests for the event-loop friendly tool dispatcher."""
+
+    def _run(self, tools, name, arguments):
+        import asyncio
+
+        from az_scout.services.ai_chat._dispatch import _execute_tool_async
+
+        with patch("az_scout.services.ai_chat._dispatch._get_mcp_tools", return_value=tools):
+            return asyncio.run(_execute_tool_async(name, arguments))
+
+    def test_limited_execution_caps_concurrency(self):
+        import asyncio
+
+        from az_scout.services.ai_chat import _dispatch
+
+        running = 0
+        peak = 0
+        slots_full = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_execute(name: str, args: dict) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            if running == 2:
+                slots_full.set()
+            await release.wait()
+            running -= 1
+            return name
+
+        async def _run_all() -> list[str]:
+            slots = asyncio.Semaphore(2)
+            calls = asyncio.gather(
+                *(_dispatch._execute_tool_limited(f"t{i}", {}, slots) for i in range(6))
+            )
+            # Every call has started or is queued on the semaphore by now
+            await slots_full.wait()
+            release.set()
+            return await calls
+
+        with patch.object(_dispatch, "_execute_tool_async", fake_execute):
+            results = asyncio.run(_run_all())
+        assert results == [f"t{i}" for i in range(6)]
+        assert peak == 2
+
+    def test_sync_tool_runs_in_thread(self):
+        import threading
+        from types import SimpleNamespace
+
+        main_thread = threading.get_ident()
+        seen: list[int] = []
+
+        def fn(**_kwargs):
+            seen.append(threading.get_ident())
+            return '{"ok": true}'
+
+        result = self._run({"t": SimpleNamespace(fn=fn)}, "t", {})
+        assert json.loads(result) == {"ok": True}
+        assert seen and seen[0] != main_thread
+
+    def test_async_tool_awaited(self):
+        from types import SimpleNamespace
+
+        async def fn(**kwargs):
+            return json.dumps({"region": kwargs["region"]})
+
+        result = self._run({"t": SimpleNamespace(fn=fn)}, "t", {"region": "eastus"})
+        assert json.loads(result) == {"region": "eastus"}
+
+    def test_async_tool_bad_args_reported(self):
+        from types import SimpleNamespace
+
+        async def fn():
+            return "{}"
+
+        result = self._run({"t": SimpleNamespace(fn=fn)}, "t", {"region": "eastus"})
+        assert "Invalid arguments for t" in json.loads(result)["error"]
+
+    def test_unknown_tool(self):
+        result = self._run({}, "nope", {})
+        assert json.loads(result) == {"error": "Unknown tool: nope"}
+
+    def test_chat_only_tools_have_handlers(self):
+        from az_scout.services.ai_chat._dispatch import _CHAT_TOOL_HANDLERS
+        from az_scout.services.ai_chat._tools import _CHAT_ONLY_TOOLS
+
+        assert set(_CHAT_TOOL_HANDLERS) == {t["function"]["name"] for t in _CHAT_ONLY_TOOLS}
+
+    def test_chat_only_tool_handled_locally(self):
+        ok = json.loads(self._run({}, "switch_tenant", {"tenant_id": "tid-1"}))
+        assert ok["status"] == "ok"
+        assert ok["tenant_id"] == "tid-1"
+        err = json.loads(self._run({}, "switch_region", {}))
+        assert err == {"error": "Missing required parameter: region."}
+
+
+# ---------------------------------------------------------------------------
+# Discovery tool result cache
+# ---------------------------------------------------------------------------
+
+
+class TestToolResultCache:
+    """Tests for the in-process TTL cache of idempotent tool results."""
+
+    def _call(self, fn, name="get_zone_mappings", arguments=None, obo=False):
+        from types import SimpleNamespace
+
+        from az_scout.services.ai_chat import _dispatch
+
+        with (
+            patch.object(_dispatch, "_get_mcp_tools", return_value={name: SimpleNamespace(fn=fn)}),
+            patch("az_scout.azure_api._obo.is_obo_enabled", return_value=obo),
+        ):
+            return _dispatch._execute_tool(name, dict(arguments or {}))
+
+    def test_repeat_call_served_from_cache(self):
+        from az_scout.services.ai_chat import _dispatch
+
+        calls: list[dict] = []
+
+        def fn(**kwargs):
+            calls.append(kwargs)
+            return '[{"name": "eastus"}]'
+
+        with patch.dict(_dispatch._tool_cache, clear=True):
+            first = self._call(fn, arguments={"tenant_id": "t1"})
+            second = self._call(fn, arguments={"tenant_id": "t1"})
+            self._call(fn, arguments={"tenant_id": "t2"})
+        assert first == second
+        assert len(calls) == 2
+
+    def test_least_recently_used_entry_evicted(self):
+        from az_scout.services.ai_chat import _dispatch
+
+        calls: list[dict] = []
+
+        def fn(**kwargs):
+            calls.append(kwargs)
+            return "[]"
+
+        with (
+            patch.dict(_dispatch._tool_cache, clear=True),
+            patch.object(_dispatch, "_TOOL_CACHE_MAX_ENTRIES", 2),
+        ):
+            self._call(fn, arguments={"tenant_id": "t1"})
+            self._call(fn, arguments={"tenant_id": "t2"})
+            self._call(fn, arguments={"tenant_id": "t1"})  # hit, t1 now most recent
+            self._call(fn, arguments={"tenant_id": "t3"})  # evicts t2
+            assert len(_dispatch._tool_cache) == 2
+            self._call(fn, arguments={"tenant_id": "t1"})  # still cached
+            self._call(fn, arguments={"tenant_id": "t2"})  # fetched again
+        assert [c["tenant_id"] for c in calls] == ["t1", "t2", "t3", "t2"]
+
+    def test_not_cached_in_obo_mode(self):
+        from az_scout.services.ai_chat import _dispatch
+
+        calls: list[dict] = []
+
+        def fn(**kwargs):
+            calls.append(kwargs)
+            return "[]"
+
+        with patch.dict(_dispatch._tool_cache, clear=True):
+            self._call(fn, obo=True)
+            self._call(fn, obo=True)
+        assert len(calls) == 2
+
+    def test_result_with_nested_error_field_cached(self):
+        from az_scout.services.ai_chat import _dispatch
+
+        calls: list[dict] = []
+
+        def fn(**kwargs):
+            calls.append(kwargs)
+            return '[{"subscriptionId": "s1", "mappings": [], "error": "denied"}]'
+
+        with patch.dict(_dispatch._tool_cache, clear=True):
+            first = self._call(fn)
+            second = self._call(fn)
+        assert first == second
+        assert len(calls) == 1
+
+    def test_errors_and_other_tools_not_cached(self):
+        from az_scout.services.ai_chat import _dispatch
+
+        calls: list[dict] = []
+
+        def fn(**kwargs):
+            calls.append(kwargs)
+            return '{"error": "boom"}'
+
+        with patch.dict(_dispatch._tool_cache, clear=True):
+            self._call(fn)
+            self._call(fn)
+            self._call(fn, name="get_sku_availability")
+            self._call(fn, name="get_sku_availability")
+            self._call(fn, name="list_regions")
+            self._call(fn, name="list_regions")
+        assert len(calls) == 6
+
+
+# ---------------------------------------------------------------------------
+# SSE formatting
+# ---------------------------------------------------------------------------
+
+
+class TestSseFormatting:
+    """Tests for the SSE frame helpers used by chat_stream."""
+
+    def test_delta_frame_matches_generic_formatter(self):
+        from az_scout.services.ai_chat._stream import _sse, _sse_delta
+
+        for content in ("hello", 'quote " and \\ backslash', "line\nbreak", "é ✓", ""):
+            assert _sse_delta(content) == _sse({"type": "delta", "content": content})
+
+    def test_done_frame(self):
+        from az_scout.services.ai_chat._stream import _SSE_DONE
+
+        assert _SSE_DONE == 'data: {"type": "done"}\n\n'
+
+
+class TestChatStream:
+    """End-to-end tests for chat_stream against a mocked Azure OpenAI endpoint."""
+
+    @staticmethod
+    def _sse_body(*chunks: dict) -> bytes:
+        frames = [f"data: {json.dumps(c)}\n\n" for c in chunks]
+        return ("".join(frames) + "data: [DONE]\n\n").encode()
+
+    @staticmethod
+    @contextmanager
+    def _patch_client(client):
+        with (
+            patch("az_scout.services.ai_chat._stream._get_http_client", return_value=client),
+            patch(
+                "az_scout.services.ai_chat._stream.AZURE_OPENAI_CHAT_URL",
+                "https://example.openai.azure.com/chat/completions",
+            ),
+        ):
+            yield
+
+    def _run(self, responses: list, on_event=None) -> tuple[list[dict], list[dict]]:
+        import asyncio
+
+        import httpx
+
+        from az_scout.services.ai_chat._stream import chat_stream
+
+        requests: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(json.loads(request.content))
+            response = responses[len(requests) - 1]
+            if isinstance(response, httpx.Response):
+                return response
+            return httpx.Response(200, content=response)
+
+        async def _collect() -> list[dict]:
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            events: list[dict] = []
+            with self._patch_client(client):
+                async for frame in chat_stream([{"role": "user", "content": "hi"}]):
+                    events.append(json.loads(frame[6:]))
+                    if on_event is not None:
+                        on_event(events[-1])
+            await client.aclose()
+            return events
+
+        return asyncio.run(_collect()), requests
+
+    def test_sse_data_split_across_network_chunks(self):
+        import asyncio
+
+        import httpx
+
+        from az_scout.services.ai_chat._stream import _iter_sse_data
+
+        async def _body():
+            for part in (
+                b'data: {"a": ',
+                b"1}\r\n\n: keep-alive\n",
+                b"data: \xc3",
+                b"\xa9\ndata: [DONE]",
+            ):
+                yield part
+
+        async def _collect() -> list[bytes]:
+            resp = httpx.Response(200, content=_body())
+            return [data async for data in _iter_sse_data(resp)]
+
+        assert asyncio.run(_collect()) == [b'{"a": 1}', "é".encode(), b"[DONE]"]
+
+    def test_throttled_request_is_resent(self):
+        import httpx
+
+        throttled = httpx.Response(429, headers={"Retry-After": "0"}, content=b"busy")
+        ok = self._sse_body({"choices": [{"delta": {"content": "Hi"}}]})
+
+        events, requests = self._run([throttled, ok])
+
+        assert events[0]["type"] == "status"
+        assert {"type": "delta", "content": "Hi"} in events
+        assert events[-1] == {"type": "done"}
+        assert len(requests) == 2
+        assert requests[0] == requests[1]
+
+    def test_empty_and_null_chunks_ignored(self):
+        body = self._sse_body(
+            {"choices": [], "prompt_filter_results": []},
+            {"choices": [{"delta": None}]},
+            {"choices": [{"delta": {"content": "A"}}]},
+            {"choices": [{"delta": {"content": None, "tool_calls": None}}]},
+            {"choices": [{"delta": {"content": "B"}, "finish_reason": "stop"}]},
+        )
+
+        events, _ = self._run([body])
+
+        assert events == [
+            {"type": "delta", "content": "A"},
+            {"type": "delta", "content": "B"},
+            {"type": "done"},
+        ]
+
+    def test_deltas_coalesced_when_enabled(self):
+        body = self._sse_body(
+            {"choices": [{"delta": {"content": "Hel"}}]},
+            {"choices": [{"delta": {"content": "lo"}}]},
+            {"choices": [{"delta": {"content": "!"}, "finish_reason": "stop"}]},
+        )
+
+        with patch("az_scout.services.ai_chat._stream.CHAT_DELTA_COALESCE_MS", 60_000):
+            events, _ = self._run([body])
+
+        assert events == [{"type": "delta", "content": "Hello!"}, {"type": "done"}]
+
+    def test_error_status_surfaced(self):
+        import httpx
+
+        events, _ = self._run([httpx.Response(400, content=b"bad request")])
+
+        assert events == [{"type": "error", "content": "bad request"}, {"type": "done"}]
+
+    def test_tool_results_streamed_as_they_finish(self):
+        import asyncio
+
+        def _call(idx: int, call_id: str, name: str) -> dict:
+            function = {"name": name, "arguments": "{}"}
+            return {"index": idx, "id": call_id, "function": function}
+
+        first = self._sse_body(
+            {
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                _call(0, "call_slow", "slow_tool"),
+                                _call(1, "call_fast", "fast_tool"),
+                            ]
+                        },
+                        "finish_reason": "tool_calls",
+                    }
+                ]
+            },
+        )
+        second = self._sse_body({"choices": [{"delta": {"content": "ok"}}]})
+
+        # slow_tool only finishes once a result has reached the client
+        result_sent = asyncio.Event()
+
+        async def fake_execute(name: str, args: dict) -> str:
+            if name == "slow_tool":
+                await asyncio.wait_for(result_sent.wait(), timeout=5)
+            return json.dumps({"tool": name})
+
+        def on_event(event: dict) -> None:
+            if event["type"] == "tool_result":
+                result_sent.set()
+
+        with patch("az_scout.services.ai_chat._dispatch._execute_tool_async", fake_execute):
+            events, requests = self._run([first, second], on_event=on_event)
+
+        results = [(e["tool_call_id"], e["name"]) for e in events if e["type"] == "tool_result"]
+        assert results == [("call_fast", "fast_tool"), ("call_slow", "slow_tool")]
+        tool_messages = [m for m in requests[1]["messages"] if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_slow", "call_fast"]
+
+    @staticmethod
+    def _tool_call_chunk(idx: int, call_id: str, name: str, **choice) -> dict:
+        function = {"name": name, "arguments": "{}"}
+        tool_call = {"index": idx, "id": call_id, "function": function}
+        return {"choices": [{"delta": {"tool_calls": [tool_call]}, **choice}]}
+
+    def test_no_tool_activity_when_round_aborted(self):
+        calls: list[str] = []
+
+        async def fake_execute(name: str, args: dict) -> str:
+            calls.append(name)
+            return "[]"
+
+        switch = self._tool_call_chunk(0, "call_a", "switch_region")
+        switch["choices"][0]["delta"]["tool_calls"][0]["function"]["arguments"] = (
+            '{"region": "westeurope"}'
+        )
+        body = self._sse_body(
+            switch,
+            self._tool_call_chunk(1, "call_b", "tool_b", finish_reason="length"),
+        )
+        with patch("az_scout.services.ai_chat._dispatch._execute_tool_async", fake_execute):
+            events, requests = self._run([body])
+
+        assert events == [{"type": "done"}]
+        assert calls == []
+        assert len(requests) == 1
+
+    def test_pending_tools_cancelled_on_disconnect(self):
+        import asyncio
+
+        import httpx
+
+        from az_scout.services.ai_chat._stream import chat_stream
+
+        cancelled = asyncio.Event()
+
+        async def fake_execute(name: str, args: dict) -> str:
+            if name == "slow_tool":
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return "[]"
+
+        body = self._sse_body(
+            self._tool_call_chunk(0, "call_slow", "slow_tool"),
+            self._tool_call_chunk(1, "call_fast", "fast_tool", finish_reason="tool_calls"),
+        )
+
+        async def _disconnect_after_first_result() -> None:
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+            client = httpx.AsyncClient(transport=transport)
+            with self._patch_client(client):
+                stream = chat_stream([{"role": "user", "content": "hi"}])
+                async for frame in stream:
+                    if '"tool_result"' in frame:
+                        break
+                await stream.aclose()
+                # Must happen before asyncio.run() cancels leftover tasks itself
+                await asyncio.wait_for(cancelled.wait(), timeout=5)
+            await client.aclose()
+
+        with patch("az_scout.services.ai_chat._dispatch._execute_tool_async", fake_execute):
+            asyncio.run(_disconnect_after_first_result())
+
+    def test_tool_call_arguments_streamed_in_fragments(self):
+        first = self._sse_body(
+            {
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {
+                                    "index": 0,
+                                    "id": "call_1",
+                                    "function": {"name": "switch_region", "arguments": '{"reg'},
+                                }
+                            ]
+                        }
+                    }
+                ]
+            },
+            {
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {"index": 0, "function": {"arguments": 'ion": "westeurope"}'}}
+                            ]
+                        }
+                    }
+                ]
+            },
+            {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]},
+        )
+        second = self._sse_body({"choices": [{"delta": {"content": "Done."}}]})
+
+        events, requests = self._run([first, second])
+
+        assert {
+            "type": "tool_call",
+            "tool_call_id": "call_1",
+            "name": "switch_region",
+            "arguments": '{"region": "westeurope"}',
+        } in events
+        assert {"type": "ui_action", "action": "switch_region", "region": "westeurope"} in events
+        assert {"type": "delta", "content": "Done."} in events
+        assert events[-1] == {"type": "done"}
+        assistant = requests[1]["messages"][-2]
+        assert assistant["tool_calls"][0]["function"]["arguments"] == '{"region": "westeurope"}'
+
+
+class TestDeltaCoalescer:
+    """Tests for merging streamed text fragments into fewer SSE frames."""
+
+    def test_disabled_passes_fragments_through(self):
+        from az_scout.services.ai_chat._stream import _DeltaCoalescer, _sse_delta
+
+        coalescer = _DeltaCoalescer(0)
+        assert coalescer.add("a") == _sse_delta("a")
+        assert coalescer.flush() is None
+
+    def test_flushes_on_size(self):
+        from az_scout.services.ai_chat._stream import (
+            _COALESCE_MAX_CHARS,
+            _DeltaCoalescer,
+            _sse_delta,
+        )
+
+        coalescer = _DeltaCoalescer(60_000)
+        assert coalescer.add("a") is None
+        chunk = "b" * _COALESCE_MAX_CHARS
+        assert coalescer.add(chunk) == _sse_delta("a" + chunk)
+        assert coalescer.flush() is None
+
+    def test_flushes_when_window_elapsed(self):
+        from az_scout.services.ai_chat import _stream
+
+        coalescer = _stream._DeltaCoalescer(10)
+        with patch.object(_stream.time, "monotonic", side_effect=[100.0, 100.001, 100.02]):
+            assert coalescer.add("a") is None
+            assert coalescer.add("b") == _stream._sse_delta("ab")
+
+
+# ---------------------------------------------------------------------------
+# Shared HTTP client
+# ---------------------------------------------------------------------------
+
+
+class TestSharedHttpClient:
+    """Tests for the pooled Azure OpenAI HTTP client."""
+
+    def test_client_reused_within_loop(self):
+        import asyncio
+
+        from az_scout.services.ai_chat._http import _get_http_client, aclose_http_client
+
+        async def _run():
+            first = _get_http_client()
+            second = _get_http_client()
+            await aclose_http_client()
+            return first, second
+
+        first, second = asyncio.run(_run())
+        assert first is second
+        assert first.is_closed
+
+    def test_client_rebuilt_for_new_loop(self):
+        import asyncio
+
+        from az_scout.services.ai_chat._http import _get_http_client, aclose_http_client
+
+        first = asyncio.run(_async_return(_get_http_client))
+
+        async def _rebuild():
+            second = _get_http_client()
+            await aclose_http_client()
+            return second
+
+        second = asyncio.run(_rebuild())
+        assert first is not second
+        assert first.is_closed
+        assert second.is_closed
+
+    def test_client_from_finished_loop_closed(self):
+        import asyncio
+
+        from az_scout.services.ai_chat._http import _get_http_client, aclose_http_client
+
+        first = asyncio.run(_async_return(_get_http_client))
+        asyncio.run(aclose_http_client())
+        assert first.is_closed
+
+
+async def _async_return(fn):
+    return fn()
+
+
+class TestHttpClientWarmUp:
+    """Tests for the startup connection pre-warm."""
+
+    def test_network_errors_ignored(self):
+        import asyncio
+
+        import httpx
+
+        from az_scout.services.ai_chat import _http
+
+        def handler(request):
+            raise httpx.ConnectError("unreachable", request=request)
+
+        async def _run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch.object(_http, "_get_http_client", return_value=client):
+                await _http.warm_up_http_client("https://example.openai.azure.com")
+            await client.aclose()
+
+        asyncio.run(_run())
+
+    def test_head_request_sent(self):
+        import asyncio
+
+        import httpx
+
+        from az_scout.services.ai_chat import _http
+
+        seen: list[str] = []
+
+        def handler(request):
+            seen.append(request.method)
+            return httpx.Response(404)
+
+        async def _run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch.object(_http, "_get_http_client", return_value=client):
+                await _http.warm_up_http_client("https://example.openai.azure.com")
+            await client.aclose()
+
+        asyncio.run(_run())
+        assert seen == ["HEAD"]
+
+    def test_pending_warm_up_cancelled_on_shutdown(self):
+        import asyncio
+
+        from fastapi.testclient import TestClient
+
+        from az_scout.app import app
+
+        states: list[str] = []
+
+        async def fake_warm_up(endpoint: str) -> None:
+            states.append("started")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                states.append("cancelled")
+                raise
+
+        with (
+            patch("az_scout.azure_api.preload_discovery"),
+            patch("az_scout.app.is_chat_enabled", return_value=True),
+            patch("az_scout.app.warm_up_http_client", fake_warm_up),
+            TestClient(app),
+        ):
+            pass
+        assert states == ["started", "cancelled"]
+
+
+class TestRetryWait:
+    """Tests for the Azure OpenAI retry delay computation."""
+
+    def test_retry_after_seconds(self):
+        from az_scout.services.ai_chat._http import _retry_wait
+
+        assert _retry_wait(0, "7") == 7.0
+        assert _retry_wait(2, "0") == 0.0
+
+    def test_retry_after_http_date(self):
+        from datetime import UTC, datetime, timedelta
+        from email.utils import format_datetime
+
+        from az_scout.services.ai_chat._http import _retry_wait
+
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=20), usegmt=True)
+        assert 15 <= _retry_wait(0, when) <= 20
+        past = format_datetime(datetime.now(UTC) - timedelta(seconds=20), usegmt=True)
+        assert _retry_wait(0, past) == 0.0
+
+    def test_retry_after_capped(self):
+        from datetime import UTC, datetime, timedelta
+        from email.utils import format_datetime
+
+        from az_scout.services.ai_chat._http import _MAX_RETRY_AFTER, _retry_wait
+
+        assert _retry_wait(0, "3600") == _MAX_RETRY_AFTER
+        later = format_datetime(datetime.now(UTC) + timedelta(hours=1), usegmt=True)
+        assert _retry_wait(0, later) == _MAX_RETRY_AFTER
+
+    def test_retry_after_fractional_and_padded(self):
+        from az_scout.services.ai_chat._http import _retry_wait
+
+        assert _retry_wait(0, " 12 ") == 12.0
+        assert _retry_wait(0, "1.5") == 1.5
+
+    def test_non_ascii_digits_fall_back_to_backoff(self):
+        from az_scout.services.ai_chat._http import _retry_wait
+
+        # str.isdigit() accepts these, float() does not
+        assert 1.0 <= _retry_wait(0, "²") < 2.0
+        assert 1.0 <= _retry_wait(0, "1²") < 2.0
+
+    def test_backoff_without_header(self):
+        from az_scout.services.ai_chat._http import _MAX_BACKOFF, _retry_wait
+
+        assert 1.0 <= _retry_wait(0) < 2.0
+        assert 4.0 <= _retry_wait(2, "not-a-date") < 5.0
+        assert _retry_wait(10) == _MAX_BACKOFF
+
+
+class TestChatRequestBody:
+    """Tests for the pre-encoded chat completions request body."""
+
+    def test_body_matches_json_payload(self):
+        from az_scout.services.ai_chat._tools import _chat_request_body
+
+        messages = [{"role": "user", "content": "héllo"}]
+        body = json.loads(_chat_request_body(messages, stream=True))
+        assert body == {
+            "messages": messages,
+            "tools": TOOL_DEFINITIONS,
+            "tool_choice": "auto",
+            "stream": True,
+        }
+
+    def test_body_without_tools(self):
+        from az_scout.services.ai_chat._tools import _chat_request_body
+
+        body = json.loads(_chat_request_body([], tools=False))
+        assert body == {"messages": []}
+
+    def test_refresh_invalidates_cached_tool_json(self):
+        from az_scout.services.ai_chat import _tools
+
+        _tools._chat_request_body([])
+        assert _tools._tool_definitions_json is not None
+        _tools.refresh_tool_definitions()
+        assert _tools._tool_definitions_json is None
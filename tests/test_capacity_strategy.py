@@ -2,9 +2,19 @@
 
 Covers:
 - best_spot_label helper (unit tests)
+- is_gpu_family helper (unit tests)
+- resolve_candidate_regions helper (unit tests)
 """
 
-from az_scout.services._evaluation_helpers import best_spot_label
+import pytest
+
+from az_scout.services import _evaluation_helpers
+from az_scout.services._evaluation_helpers import (
+    DATA_RESIDENCY_REGIONS,
+    best_spot_label,
+    is_gpu_family,
+    resolve_candidate_regions,
+)
 
 # ---------------------------------------------------------------------------
 # Helper tests
@@ -20,3 +30,96 @@ class TestBestSpotLabel:
 
     def test_low_only(self) -> None:
         assert best_spot_label({"1": "Low"}) == "Low"
+
+    def test_unrecognised_labels(self) -> None:
+        assert best_spot_label({"1": "RestrictedSkuNotAvailable", "2": "Unknown"}) == "Unknown"
+
+    def test_first_of_equal_rank_wins(self) -> None:
+        assert best_spot_label({"1": "Restricted", "2": "Medium", "3": "Medium"}) == "Medium"
+
+
+class TestIsGpuFamily:
+    @pytest.mark.parametrize(
+        "family",
+        [
+            "standardNCSv3Family",
+            "standardNDSv2Family",
+            "standardNVSv4Family",
+            "standardHBv3Family",
+            "standardHCSFamily",
+            "Standard_NC24ads_A100_v4",
+            "standard_nd",
+            "NCasT4_v3",
+            # Underscores are dropped before the prefix check
+            "N_C24",
+            "Standard_H_Bv3",
+            "_standard__NV",
+        ],
+    )
+    def test_gpu_families(self, family: str) -> None:
+        assert is_gpu_family(family)
+
+    @pytest.mark.parametrize(
+        "family",
+        [
+            "standardDSv3Family",
+            "Standard_D2s_v5",
+            "standardFSv2Family",
+            "",
+            "xnc",
+            "stan_dardNC",
+        ],
+    )
+    def test_non_gpu_families(self, family: str) -> None:
+        assert not is_gpu_family(family)
+
+
+def _resolve(**overrides: object) -> list[str]:
+    kwargs: dict[str, object] = {
+        "allow_regions": None,
+        "deny_regions": None,
+        "data_residency": None,
+        "subscription_id": "sub-1",
+        "tenant_id": None,
+        "warnings": [],
+        "errors": [],
+    }
+    kwargs.update(overrides)
+    return resolve_candidate_regions(**kwargs)  # type: ignore[arg-type]
+
+
+class TestResolveCandidateRegions:
+    def test_allow_list_is_copied(self) -> None:
+        allow = ["westeurope", "francecentral"]
+        result = _resolve(allow_regions=allow)
+        assert result == allow
+        assert result is not allow
+
+    def test_deny_applies_to_mixed_case_allow_list(self) -> None:
+        result = _resolve(allow_regions=["WestEurope", "eastus"], deny_regions=["westeurope"])
+        assert result == ["eastus"]
+
+    def test_data_residency_returns_fresh_list(self) -> None:
+        result = _resolve(data_residency="FR")
+        assert result == list(DATA_RESIDENCY_REGIONS["FR"])
+        result.append("westeurope")
+        assert "westeurope" not in DATA_RESIDENCY_REGIONS["FR"]
+
+    def test_deny_is_case_insensitive_and_truncates(self) -> None:
+        result = _resolve(data_residency="EU", deny_regions=["FranceCentral"], max_regions=2)
+        assert result == ["francesouth", "westeurope"]
+
+    def test_negative_max_regions_slices_from_end(self) -> None:
+        result = _resolve(data_residency="FR", max_regions=-1)
+        assert result == ["francecentral"]
+
+    def test_falls_back_to_all_regions(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            _evaluation_helpers,
+            "fetch_all_regions",
+            lambda *_args: ["eastus", "westus2", "westeurope"],
+        )
+        warnings: list[str] = []
+        result = _resolve(data_residency="XX", deny_regions=["westus2"], warnings=warnings)
+        assert result == ["eastus", "westeurope"]
+        assert warnings and "XX" in warnings[0]
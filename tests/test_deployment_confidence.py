@@ -7,16 +7,19 @@ Covers:
   - Regression: JS files must not contain local scoring code
 """
 
+import datetime
 import pathlib
 
 import pytest
 
 from az_scout.scoring.deployment_confidence import (
     DISCLAIMERS,
+    LABEL_THRESHOLDS,
     MIN_SIGNALS,
     WEIGHTS,
     DeploymentSignals,
     _check_knockouts,
+    _label_for_score,
     _normalize_price_pressure,
     _normalize_quota_pressure,
     _normalize_restriction_density,
@@ -24,6 +27,7 @@ from az_scout.scoring.deployment_confidence import (
     _normalize_zones,
     best_spot_label,
     compute_deployment_confidence,
+    enrich_skus_with_confidence,
     signals_from_sku,
 )
 
@@ -133,6 +137,10 @@ class TestNormalizeSpot:
     def test_low(self):
         assert _normalize_spot("Low") == 0.25
 
+    def test_uncommon_casing_falls_back_to_lower(self):
+        assert _normalize_spot("HIGH") == 1.0
+        assert _normalize_spot("mEdIuM") == 0.6
+
     def test_unknown_label_returns_none(self):
         assert _normalize_spot("Unknown") is None
 
@@ -266,6 +274,11 @@ class TestComputeDeploymentConfidence:
         assert result.score == 0
         assert result.label == "Unknown"
         assert len(result.missingSignals) == 5
+        assert result.missingSignals == list(WEIGHTS)
+        assert [c.name for c in result.breakdown.components] == list(WEIGHTS)
+        assert all(c.status == "missing" and c.reasonIfMissing for c in result.breakdown.components)
+        assert result.breakdown.weightsUsedSum == 0.0
+        assert result.breakdown.renormalized is False
 
     def test_single_signal_below_min_signals(self):
         """Only one signal: below MIN_SIGNALS → Unknown."""
@@ -374,6 +387,11 @@ class TestComputeDeploymentConfidence:
         assert 60 <= medium.score < 80
         assert medium.label == "Medium"
 
+    @pytest.mark.parametrize("score", range(0, 101))
+    def test_label_lookup_matches_thresholds(self, score):
+        expected = next(lbl for threshold, lbl in LABEL_THRESHOLDS if score >= threshold)
+        assert _label_for_score(score) == expected
+
     def test_breakdown_weights_sum_to_one(self):
         result = compute_deployment_confidence(
             DeploymentSignals(
@@ -439,6 +457,17 @@ class TestComputeDeploymentConfidence:
         assert result.provenance.computedAtUtc is not None
         assert len(result.provenance.computedAtUtc) > 0
 
+    def test_provenance_timestamp_is_utc(self):
+        result = compute_deployment_confidence(
+            DeploymentSignals(
+                zones_available_count=3, zones_total_count=3, restricted_zones_count=0
+            )
+        )
+        stamp = datetime.datetime.fromisoformat(result.provenance.computedAtUtc)
+        assert stamp.utcoffset() == datetime.timedelta(0)
+        now = datetime.datetime.now(datetime.UTC)
+        assert abs((now - stamp).total_seconds()) < 5
+
     def test_model_dump_round_trip(self):
         """Result can be serialised to dict and back."""
         result = compute_deployment_confidence(
@@ -573,6 +602,10 @@ class TestBestSpotLabel:
     def test_case_insensitive(self):
         assert best_spot_label({"1": "low", "2": "HIGH"}) == "HIGH"
 
+    def test_first_of_equal_rank_wins(self):
+        assert best_spot_label({"1": "medium", "2": "Medium", "3": "Low"}) == "medium"
+        assert best_spot_label({"1": "High", "2": "high"}) == "High"
+
     def test_unknown_labels_returns_fallback(self):
         # "Unknown" is not in the scoring map but zone data exists,
         # so the first label is returned as a fallback.
@@ -624,6 +657,14 @@ class TestSignalsFromSku:
         assert sig.paygo_price == 1.0
         assert sig.spot_price == 0.3
 
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("4", 4), (8, 8), ("2.0", None), ("n/a", None), (None, None), (4.0, 4)],
+    )
+    def test_vcpus_parsing(self, raw, expected):
+        sig = signals_from_sku({"capabilities": {"vCPUs": raw}})
+        assert sig.vcpus == expected
+
     def test_instance_count_passed_through(self):
         sku = {"capabilities": {"vCPUs": "2"}, "zones": ["1", "2", "3"]}
         sig = signals_from_sku(sku, instance_count=5)
@@ -636,6 +677,53 @@ class TestSignalsFromSku:
         assert sig.zones_total_count == 3
         assert sig.restricted_zones_count == 0
 
+    def test_null_sections_read_as_empty(self):
+        sku = {
+            "capabilities": None,
+            "quota": None,
+            "pricing": None,
+            "zones": None,
+            "restrictions": None,
+        }
+        assert signals_from_sku(sku) == signals_from_sku({})
+
+
+class TestEnrichSkusWithConfidence:
+    @pytest.mark.parametrize(
+        "sku",
+        [
+            {},
+            {"zones": ["1", "2", "3"]},
+            {
+                "capabilities": {"vCPUs": "4"},
+                "zones": ["1", "2", "3"],
+                "restrictions": ["2"],
+                "quota": {"used": 80, "limit": 100, "remaining": 20},
+                "pricing": {"paygo": 1.0, "spot": 0.3},
+            },
+            {
+                "capabilities": {"vCPUs": "8"},
+                "zones": ["1"],
+                "quota": {"used": 98, "limit": 100, "remaining": 2},
+            },
+        ],
+    )
+    def test_matches_model_dump(self, sku):
+        """The dict fast path must be identical to the public model's dump."""
+        expected = compute_deployment_confidence(signals_from_sku(sku)).model_dump()
+        skus = [dict(sku)]
+        enrich_skus_with_confidence(skus)
+        actual = skus[0]["confidence"]
+        for payload in (expected, actual):
+            payload["provenance"].pop("computedAtUtc")
+        assert actual == expected
+
+    def test_batch_shares_timestamp(self):
+        skus = [{"zones": ["1", "2", "3"]} for _ in range(50)]
+        enrich_skus_with_confidence(skus)
+        stamps = {s["confidence"]["provenance"]["computedAtUtc"] for s in skus}
+        assert len(stamps) == 1
+
 
 # ===================================================================
 # Knockout layer
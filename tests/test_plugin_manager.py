@@ -1,5 +1,6 @@
 """Tests for the plugin manager (business logic + API routes)."""
 
+import dataclasses
 import json
 import os
 import sys
@@ -229,6 +230,61 @@ class TestPersistence:
         assert loaded[0].distribution_name == "az-scout-example"
         assert loaded[0].resolved_sha == SAMPLE_SHA
 
+    def test_load_reuses_parse_until_file_changes(self, tmp_path: Path) -> None:
+        installed_file = tmp_path / "installed.json"
+        record = InstalledPluginRecord(
+            distribution_name="az-scout-example",
+            repo_url="https://github.com/owner/repo",
+            ref="v1.0.0",
+            resolved_sha=SAMPLE_SHA,
+            entry_points={"example": "mod:obj"},
+            installed_at="2026-02-28T00:00:00+00:00",
+            actor="tester",
+        )
+        with (
+            patch.object(_pm_storage, "_INSTALLED_FILE", installed_file),
+            patch.object(_pm_storage, "_DATA_DIR", tmp_path),
+        ):
+            save_installed([record])
+            with patch.object(_pm_storage.json, "loads", wraps=json.loads) as spy:
+                first = load_installed()
+                second = load_installed()
+            assert spy.call_count == 1
+            # Records are independent objects even when served from the cache
+            assert first[0] is not second[0]
+            first[0].entry_points["other"] = "x"
+            assert "other" not in load_installed()[0].entry_points
+
+            record.ref = "v2.0.0"
+            save_installed([record])
+            assert load_installed()[0].ref == "v2.0.0"
+
+    def test_to_dict_matches_asdict(self) -> None:
+        record = InstalledPluginRecord(
+            distribution_name="az-scout-example",
+            repo_url="https://github.com/owner/repo",
+            ref="v1.0.0",
+            resolved_sha=SAMPLE_SHA,
+            entry_points={"example": "mod:obj"},
+            installed_at="2026-02-28T00:00:00+00:00",
+            actor="tester",
+            update_available=True,
+        )
+        result = PluginValidationResult(
+            ok=False,
+            owner="owner",
+            repo="repo",
+            repo_url="https://github.com/owner/repo",
+            ref="v1.0.0",
+            entry_points={"example": "mod:obj"},
+            warnings=["w"],
+            errors=["e"],
+        )
+        assert record.to_dict() == dataclasses.asdict(record)
+        assert result.to_dict() == dataclasses.asdict(result)
+        # Mutable containers are copied, not shared with the record
+        assert record.to_dict()["entry_points"] is not record.entry_points
+
     def test_audit_appends(self, tmp_path: Path) -> None:
         audit_file = tmp_path / "audit.jsonl"
         with (
@@ -252,6 +308,25 @@ class TestPersistence:
 
 
 class TestPluginRoutes:
+    def test_actor_from_easyauth_headers(self) -> None:
+        from starlette.requests import Request
+
+        from az_scout.routes import _actor
+
+        request = Request(
+            {
+                "type": "http",
+                "headers": [
+                    (b"user-agent", b"ua/1.0"),
+                    (b"x-ms-client-principal-name", b"alice@example.com"),
+                    (b"x-ms-client-principal-name", b"ignored@example.com"),
+                ],
+                "client": ("10.0.0.1", 1234),
+            }
+        )
+        assert _actor(request) == ("alice@example.com", "10.0.0.1", "ua/1.0")
+        assert _actor(Request({"type": "http", "headers": []})) == ("anonymous", "", "")
+
     def test_list_plugins(self, client) -> None:  # type: ignore[no-untyped-def]
         with (
             patch.object(_pm_storage, "load_installed", return_value=[]),
@@ -586,6 +661,51 @@ class TestCheckUpdates:
         assert results[0]["latest_ref"] == "v2.0.0"
         assert results[0]["latest_sha"] == SAMPLE_SHA_2
 
+    def test_check_updates_many_plugins_keeps_order(self, tmp_path: Path) -> None:
+        installed_file = tmp_path / "installed.json"
+        audit_file = tmp_path / "audit.jsonl"
+        data = [
+            {
+                "distribution_name": f"az-scout-{name}",
+                "repo_url": f"https://github.com/owner/{name}",
+                "ref": "v1.0.0",
+                "resolved_sha": SAMPLE_SHA,
+                "entry_points": {},
+                "installed_at": "2026-02-28T00:00:00+00:00",
+                "actor": "tester",
+            }
+            for name in ("a", "b", "c")
+        ]
+        data.append({**data[0], "distribution_name": "az-scout-bad", "repo_url": "not-a-url"})
+        installed_file.write_text(json.dumps(data), encoding="utf-8")
+
+        def mock_fetch_latest(owner: str, repo: str) -> tuple[str, str]:
+            if repo == "b":
+                raise requests.ConnectionError("boom")
+            return ("v2.0.0", SAMPLE_SHA_2 if repo == "a" else SAMPLE_SHA)
+
+        with (
+            patch.object(_pm_storage, "_INSTALLED_FILE", installed_file),
+            patch.object(_pm_storage, "_DATA_DIR", tmp_path),
+            patch.object(_pm_storage, "_AUDIT_FILE", audit_file),
+            patch(
+                "az_scout.plugin_manager._operations.fetch_latest_ref",
+                side_effect=mock_fetch_latest,
+            ),
+        ):
+            results = plugin_manager.check_updates("actor", "127.0.0.1", "test-agent")
+
+        assert [r["distribution_name"] for r in results] == [
+            "az-scout-a",
+            "az-scout-b",
+            "az-scout-c",
+            "az-scout-bad",
+        ]
+        assert results[0]["update_available"] is True
+        assert results[1]["error"] == "boom"
+        assert results[2]["update_available"] is False
+        assert results[3]["error"] == "Invalid GitHub URL"
+
     def test_check_updates_up_to_date(self, tmp_path: Path) -> None:
         installed_file = tmp_path / "installed.json"
         audit_file = tmp_path / "audit.jsonl"